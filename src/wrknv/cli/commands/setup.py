@@ -13,7 +13,6 @@ from pathlib import Path
 import shutil
 
 from provide.foundation.cli import echo_error, echo_info, echo_success
-from provide.foundation.console.output import pout
 from provide.foundation.errors import NotFoundError
 from provide.foundation.hub import register_command
 from provide.foundation.process import ProcessError, run
@@ -85,11 +84,10 @@ def setup_command(
 
     if completions:
         # Generate shell completions
-        from wrknv.wenv.completions import generate_completions
-
-        completion_script = generate_completions(completions)
+        from wrknv.wenv.completions import generate_completions, write_completions
 
         if install:
+            completion_script = generate_completions(completions)
             # Install completions to appropriate location
             install_path = None
             if completions == "bash":
@@ -132,8 +130,8 @@ def setup_command(
                     echo_info(f"  fpath=({install_path.parent} $fpath)")
                     echo_info("  autoload -U compinit && compinit")
         else:
-            # Just output the completion script
-            pout(completion_script)
+            # Stream the pre-encoded script bytes straight to stdout
+            write_completions(completions)
         return
 
     if init:
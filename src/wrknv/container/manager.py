@@ -319,15 +319,24 @@ class ContainerManager:
             if not volumes_dir.exists():
                 return True
 
-            for volume_path in volumes_dir.iterdir():
-                if volume_path.is_dir():
-                    if preserve and volume_path.name in preserve:
-                        logger.debug("Preserving volume", volume=volume_path.name)
-                        continue
-
-                    shutil.rmtree(volume_path)
-                    volume_path.mkdir(exist_ok=True)
-                    logger.info("🗑️ Cleaned volume", volume=volume_path.name)
+            volume_paths = [p for p in volumes_dir.iterdir() if p.is_dir()]
+
+            # Bind the batch context once; per-item entries stay at debug so a
+            # large cleanup emits a single info line instead of N of them.
+            log = logger.bind(operation="clean_volumes", count=len(volume_paths))
+            cleaned = []
+            for volume_path in volume_paths:
+                if preserve and volume_path.name in preserve:
+                    log.debug("Preserving volume", volume=volume_path.name)
+                    continue
+
+                shutil.rmtree(volume_path)
+                volume_path.mkdir(exist_ok=True)
+                log.debug("Cleaned volume", volume=volume_path.name)
+                cleaned.append(volume_path.name)
+
+            if cleaned:
+                log.info("🗑️ Cleaned volumes", cleaned=cleaned)
 
             return True
 
@@ -50,10 +50,11 @@ class ContainerLifecycle:
             True if successful
         """
         try:
-            # Check if container exists
-            if self.runtime.container_exists(self.container_name):
+            # One round-trip answers both "exists?" and "running?"
+            state = self.runtime.container_state(self.container_name)
+            if state != "missing":
                 # Container exists, just start it
-                if self.runtime.container_running(self.container_name):
+                if state == "running":
                     self.console.print(
                         f"[yellow]⚠️  Container {self.container_name} is already running[/yellow]"
                     )
@@ -161,12 +162,12 @@ class ContainerLifecycle:
             Status information dictionary
         """
         try:
-            exists = self.runtime.container_exists(self.container_name)
-            running = False
+            state = self.runtime.container_state(self.container_name)
+            exists = state != "missing"
+            running = state == "running"
             info = {}
 
             if exists:
-                running = self.runtime.container_running(self.container_name)
                 info = self.runtime.inspect_container(self.container_name)
 
             status = {
@@ -212,12 +213,13 @@ class ContainerLifecycle:
             True if successful
         """
         try:
-            if not self.runtime.container_exists(self.container_name):
+            state = self.runtime.container_state(self.container_name)
+            if state == "missing":
                 self.console.print(f"[yellow]⚠️  Container {self.container_name} does not exist[/yellow]")
                 return True
 
             # Stop first if running and not forcing
-            if not force and self.runtime.container_running(self.container_name):
+            if not force and state == "running":
                 self.console.print(
                     f"[yellow]⚠️  Stopping container {self.container_name} before removal[/yellow]"
                 )
@@ -9,6 +9,7 @@ Manage container volumes and mounts."""
 
 from __future__ import annotations
 
+from functools import lru_cache
 import json
 from pathlib import Path
 from typing import Any
@@ -23,6 +24,16 @@ from rich.table import Table
 from wrknv.container.runtime.base import ContainerRuntime
 
 
+@lru_cache(maxsize=32)
+def _filter_args(label: str | None) -> tuple[str, ...]:
+    """Reusable ``--filter`` argv fragment for volume listing.
+
+    Cached so repeated polls with the same label skip the per-call
+    f-string and list allocation.
+    """
+    return () if not label else ("--filter", f"label={label}")
+
+
 @define
 class VolumeManager:
     """Manages container volume operations."""
@@ -101,10 +112,14 @@ class VolumeManager:
             List of volume information
         """
         try:
-            cmd = [self.runtime.runtime_command, "volume", "ls", "--format", "json"]
-
-            if filter_label:
-                cmd.extend(["--filter", f"label={filter_label}"])
+            cmd = [
+                self.runtime.runtime_command,
+                "volume",
+                "ls",
+                "--format",
+                "json",
+                *_filter_args(filter_label),
+            ]
 
             result = run(cmd, check=True)
 
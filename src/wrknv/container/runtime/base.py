@@ -10,7 +10,7 @@ Abstract base class for container runtime implementations."""
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Literal
 
 from attrs import define
 from provide.foundation.process import CompletedProcess
@@ -136,6 +136,22 @@ class ContainerRuntime(ABC):
             True if container is running
         """
 
+    def container_state(self, name: str) -> Literal["missing", "stopped", "running"]:
+        """Get container existence and run state.
+
+        Runtimes that can answer both questions in one round-trip should
+        override this; the default composes the two individual checks.
+
+        Args:
+            name: Container name
+
+        Returns:
+            "missing", "stopped", or "running"
+        """
+        if not self.container_exists(name):
+            return "missing"
+        return "running" if self.container_running(name) else "stopped"
+
     @abstractmethod
     def get_container_logs(
         self,
@@ -10,9 +10,10 @@ Docker-specific implementation of the container runtime."""
 from __future__ import annotations
 
 import json
-from typing import Any
+import re
+from typing import Any, Literal
 
-from attrs import define
+from attrs import define, field
 from provide.foundation import logger
 from provide.foundation.process import (
     CompletedProcess,
@@ -31,6 +32,11 @@ class DockerRuntime(ContainerRuntime):
     runtime_name: str
     runtime_command: str
 
+    # A daemon that has answered once is assumed up for the rest of this
+    # process; repeated status checks reuse the first successful probe
+    # instead of spawning `docker version` again.
+    _probe_succeeded: bool = field(init=False, default=False)
+
     def run_container(
         self,
         image: str,
@@ -184,21 +190,36 @@ class DockerRuntime(ContainerRuntime):
             )
             raise
 
-    def container_exists(self, name: str) -> bool:
-        """Check if Docker container exists."""
+    def container_state(self, name: str) -> Literal["missing", "stopped", "running"]:
+        """Get container existence and run state in a single daemon round-trip."""
+        cmd = [
+            self.runtime_command,
+            "ps",
+            "-a",
+            "--filter",
+            f"name=^{re.escape(name)}$",
+            "--format",
+            "{{.Names}}\t{{.State}}",
+        ]
         try:
-            result = run([self.runtime_command, "ps", "-a", "--format", "{{.Names}}"], check=False)
-            return name in result.stdout.splitlines() if result.stdout else False
+            result = run(cmd, check=False)
         except ProcessError:
-            return False
+            return "missing"
+
+        # The name filter matches as a regex, so confirm the exact name.
+        for line in (result.stdout or "").splitlines():
+            candidate, _, state = line.partition("\t")
+            if candidate == name:
+                return "running" if state == "running" else "stopped"
+        return "missing"
+
+    def container_exists(self, name: str) -> bool:
+        """Check if Docker container exists."""
+        return self.container_state(name) != "missing"
 
     def container_running(self, name: str) -> bool:
         """Check if Docker container is running."""
-        try:
-            result = run([self.runtime_command, "ps", "--format", "{{.Names}}"], check=False)
-            return name in result.stdout.splitlines() if result.stdout else False
-        except ProcessError:
-            return False
+        return self.container_state(name) == "running"
 
     def get_container_logs(
         self,
@@ -290,17 +311,27 @@ class DockerRuntime(ContainerRuntime):
             logger.error("Failed to inspect Docker container", name=name, error=str(e))
             return {}
 
+    def is_available(self) -> bool:
+        """Check if Docker is available.
+
+        A successful probe is cached for the lifetime of this runtime
+        instance; only the first call pays the subprocess cost.
+        Failures go through a circuit breaker to prevent repeated checks
+        when Docker is unavailable. If the circuit is open, raises
+        RuntimeError which callers should catch.
+        """
+        if self._probe_succeeded:
+            return True
+        self._probe_succeeded = self._probe_daemon()
+        return self._probe_succeeded
+
     @circuit_breaker(
         failure_threshold=3,
         recovery_timeout=30.0,
         expected_exception=(ProcessError, OSError),
     )
-    def is_available(self) -> bool:
-        """Check if Docker is available.
-
-        Uses circuit breaker to prevent repeated checks when Docker is unavailable.
-        If circuit is open, raises RuntimeError which callers should catch.
-        """
+    def _probe_daemon(self) -> bool:
+        """Probe the Docker daemon with `docker version`."""
         try:
             result = run([self.runtime_command, "version"], check=False)
             if result.returncode != 0:
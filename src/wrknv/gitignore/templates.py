@@ -9,14 +9,15 @@ Manages gitignore templates from GitHub's collection."""
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from itertools import chain
+import os
 from pathlib import Path
 import tempfile
 
 from provide.foundation import logger
-from provide.foundation.archive.operations import ArchiveOperations
 from provide.foundation.file import safe_move, safe_rmtree
 from provide.foundation.resilience import retry
-from provide.foundation.transport import get
 
 from wrknv.config.defaults import (
     GITHUB_GITIGNORE_API,
@@ -43,6 +44,12 @@ class TemplateHandler:
         self.cache_dir = self.cache_dir.expanduser()
         logger.debug(f"TemplateHandler initialized with cache_dir: {self.cache_dir}")
 
+        # Memoized per instance: cache validity cannot change within one
+        # CLI invocation except through update_cache().
+        self._cache_valid: bool | None = None
+        self._all_templates: list[str] | None = None
+        self._lower_index: list[tuple[str, str]] | None = None
+
         # Create cache directory if it doesn't exist
         if not self.cache_dir.exists():
             logger.info(f"Creating gitignore template cache directory: {self.cache_dir}")
@@ -68,52 +75,91 @@ class TemplateHandler:
         logger.info("Updating gitignore templates from GitHub...")
 
         try:
-            # Download archive to temp file using foundation download
-            from wrknv.wenv.operations.download import download_file
-
-            # Use NamedTemporaryFile but don't delete automatically
-            with tempfile.NamedTemporaryFile(suffix=".tar.gz", delete=False) as tmp_file:
-                tmp_path = Path(tmp_file.name)
-
-            logger.debug(f"Downloading templates archive to {tmp_path}")
-            download_file(self.GITHUB_ARCHIVE, tmp_path, show_progress=False)
-
-            # Extract archive using foundation utilities
-            logger.debug("Extracting templates archive")
-            with tempfile.TemporaryDirectory() as extract_dir:
-                # Extract with security validation (path traversal protection)
-                ArchiveOperations.extract_tar_gz(tmp_path, Path(extract_dir))
+            # Stream the archive straight from GitHub into a staging dir
+            # next to cache_dir: /tmp is often a different filesystem,
+            # which would turn the final move into a full copy of every
+            # extracted file instead of one rename.
+            logger.debug("Streaming templates archive from GitHub")
+            extract_dir = Path(tempfile.mkdtemp(prefix=".gitignore-staging-", dir=self.cache_dir.parent))
+            try:
+                self._extract_archive_stream(extract_dir)
 
                 # Find root directory (usually gitignore-main)
-                extracted_items = list(Path(extract_dir).iterdir())
+                extracted_items = list(extract_dir.iterdir())
                 if not extracted_items:
                     raise ValueError("Archive is empty")
 
-                source_dir = extracted_items[0] if len(extracted_items) == 1 else Path(extract_dir)
+                source_dir = extracted_items[0] if len(extracted_items) == 1 else extract_dir
 
                 # Clear existing cache
                 if self.cache_dir.exists():
                     logger.debug("Clearing existing cache")
                     safe_rmtree(self.cache_dir)
 
-                # Move extracted files to cache
-                safe_move(source_dir, self.cache_dir)
-
-            # Clean up temp file
-            tmp_path.unlink()
+                # Promote the staged files to cache. Same filesystem, so
+                # this is a single inode operation; safe_move remains as
+                # a defensive fallback.
+                try:
+                    os.rename(source_dir, self.cache_dir)
+                except OSError:
+                    safe_move(source_dir, self.cache_dir)
+            finally:
+                safe_rmtree(extract_dir, missing_ok=True)
 
             # Update version file with current commit
             self._update_version_file()
 
+            self._cache_valid = True
+            self._all_templates = None
+            self._lower_index = None
+
             logger.info(f"Successfully updated templates in {self.cache_dir}")
             return True
 
         except Exception as e:
             logger.error(f"Failed to update template cache: {e}")
+            self._cache_valid = None
+            self._all_templates = None
+            self._lower_index = None
             return False
 
+    def _extract_archive_stream(self, extract_root: Path) -> None:
+        """Stream the GitHub archive into extract_root without a temp file.
+
+        Bytes flow socket -> gunzip -> extraction; tarfile's streaming
+        mode needs no seek(), so the compressed archive never touches
+        disk and the extra write+read pass of a download file is gone.
+        """
+        import tarfile
+        import urllib.request
+
+        from provide.foundation.archive.security import is_safe_path
+
+        with (
+            urllib.request.urlopen(self.GITHUB_ARCHIVE, timeout=30) as response,  # nosec B310 - constant https URL
+            tarfile.open(fileobj=response, mode="r|gz") as tar,
+        ):
+            for member in tar:
+                # Path-traversal protection, same as the old archive helper
+                if not is_safe_path(extract_root, member.name):
+                    logger.warning(f"Skipping unsafe archive member: {member.name}")
+                    continue
+                tar.extract(member, extract_root)  # nosec B202 - member validated above
+
     def _is_cache_valid(self) -> bool:
-        """Check if the cache is valid and recent enough."""
+        """Check if the cache is valid and recent enough.
+
+        The result is memoized on the instance to avoid repeated stat
+        calls when several public methods run in one invocation.
+        """
+        if self._cache_valid is not None:
+            return self._cache_valid
+
+        self._cache_valid = self._check_cache()
+        return self._cache_valid
+
+    def _check_cache(self) -> bool:
+        """Perform the actual filesystem checks behind _is_cache_valid."""
         version_file = self.cache_dir / ".version"
 
         if not version_file.exists():
@@ -131,14 +177,46 @@ class TemplateHandler:
         logger.debug("Cache validation passed")
         return True
 
-    @retry(Exception, max_attempts=3, base_delay=1.0)
+    @retry(Exception, max_attempts=3, base_delay=1.0, jitter=True)
     def _fetch_commit_sha(self) -> str:
-        """Fetch latest commit SHA from GitHub API with retry."""
-        import asyncio
+        """Fetch latest commit SHA from GitHub API with retry.
+
+        A plain synchronous GET; spinning up an event loop for one
+        request cost more than the request itself. Jitter on the retry
+        delays keeps concurrent wrknv invocations from hammering the
+        unauthenticated GitHub API in lockstep.
+
+        Sends the previously stored ETag so an unchanged upstream
+        answers 304, which does not count against the unauthenticated
+        rate limit; in that case the cached version is reused.
+        """
+        import json
+        import urllib.error
+        import urllib.request
 
         logger.debug("Fetching latest commit SHA from GitHub API")
-        response = asyncio.run(get(f"{self.GITHUB_API}/commits/main"))
-        data = response.json()
+        url = f"{self.GITHUB_API}/commits/main"
+        etag_file = self.cache_dir / ".etag"
+        version_file = self.cache_dir / ".version"
+
+        headers = {}
+        if etag_file.exists() and version_file.exists():
+            headers["If-None-Match"] = etag_file.read_text().strip()
+
+        request = urllib.request.Request(url, headers=headers)  # noqa: S310
+        try:
+            with urllib.request.urlopen(request, timeout=5) as response:  # nosec B310 - constant https URL
+                data = json.load(response)
+                etag = response.headers.get("ETag")
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                logger.debug("GitHub commit unchanged (HTTP 304), reusing cached version")
+                return version_file.read_text().strip()
+            raise
+
+        if etag:
+            etag_file.write_text(etag)
+
         sha: str = data["sha"]
         return sha[:8]
 
@@ -164,6 +242,25 @@ class TemplateHandler:
         version_file.write_text(commit_sha)
         logger.debug(f"Updated version file with: {commit_sha}")
 
+    def _scan_gitignores(self, root: Path | str, recursive: bool = False) -> Iterator[str]:
+        """Yield template names under root (relative, without suffix).
+
+        Uses os.scandir so file-type checks come from the cached DirEntry
+        instead of the extra stat() per entry that glob/rglob incurs.
+        """
+        try:
+            entries = os.scandir(root)
+        except OSError:
+            return
+
+        with entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.endswith(".gitignore"):
+                    yield entry.name[: -len(".gitignore")]
+                elif recursive and entry.is_dir():
+                    for sub in self._scan_gitignores(entry.path, recursive=True):
+                        yield f"{entry.name}/{sub}"
+
     def get_template(self, name: str) -> str | None:
         """
         Get the content of a gitignore template.
@@ -209,38 +306,33 @@ class TemplateHandler:
             logger.info("Cache invalid, updating templates...")
             self.update_cache()
 
-        templates = []
+        if category is None and self._all_templates is not None:
+            return list(self._all_templates)
 
         if category:
             # List templates in specific category
-            category_dir = self.cache_dir / category
-            if category_dir.exists():
-                logger.debug(f"Listing templates in category: {category}")
-                for file in category_dir.glob("*.gitignore"):
-                    templates.append(file.stem)
+            logger.debug(f"Listing templates in category: {category}")
+            templates = list(self._scan_gitignores(self.cache_dir / category))
         else:
-            # List all templates
+            # List all templates: root level, Global, and community
+            # (nested one or more levels deep), gathered in one pass.
             logger.debug("Listing all templates")
-
-            # Root level templates
-            for file in self.cache_dir.glob("*.gitignore"):
-                templates.append(file.stem)
-
-            # Global templates
-            global_dir = self.cache_dir / "Global"
-            if global_dir.exists():
-                for file in global_dir.glob("*.gitignore"):
-                    templates.append(f"Global/{file.stem}")
-
-            # Community templates
-            community_dir = self.cache_dir / "community"
-            if community_dir.exists():
-                for file in community_dir.rglob("*.gitignore"):
-                    relative = file.relative_to(community_dir)
-                    templates.append(f"community/{relative.with_suffix('').as_posix()}")
+            templates = list(
+                chain(
+                    self._scan_gitignores(self.cache_dir),
+                    (f"Global/{name}" for name in self._scan_gitignores(self.cache_dir / "Global")),
+                    (
+                        f"community/{name}"
+                        for name in self._scan_gitignores(self.cache_dir / "community", recursive=True)
+                    ),
+                )
+            )
 
         logger.debug(f"Found {len(templates)} templates")
-        return sorted(templates)
+        templates = sorted(templates)
+        if category is None:
+            self._all_templates = templates
+        return templates
 
     def search_templates(self, pattern: str) -> list[str]:
         """
@@ -253,9 +345,13 @@ class TemplateHandler:
             List of matching template names
         """
         pattern_lower = pattern.lower()
-        all_templates = self.list_templates()
 
-        matches = [t for t in all_templates if pattern_lower in t.lower()]
+        # Lazily built (name, lowercase name) index so repeated searches
+        # (e.g. shell completion) don't re-lowercase every template name.
+        if self._lower_index is None:
+            self._lower_index = [(t, t.lower()) for t in self.list_templates()]
+
+        matches = [t for t, t_lower in self._lower_index if pattern_lower in t_lower]
         logger.debug(f"Found {len(matches)} templates matching '{pattern}'")
 
         return matches
@@ -14,11 +14,25 @@ from pathlib import Path
 from typing import Any
 
 from attrs import define, field
+import cattrs
 
 from wrknv import __version__
 from wrknv.config import WorkenvConfig
 
 
+def _compute_config_checksum(config: WorkenvConfig) -> str:
+    """Compute the short checksum identifying a config's contents.
+
+    Canonical JSON gives a stable byte sequence across Python versions
+    (str() of nested dicts does not) and feeds fewer bytes into the
+    digest than the tuple repr did.
+    """
+    import json
+
+    config_str = json.dumps(config.to_dict(), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(config_str.encode()).hexdigest()[:12]
+
+
 @define
 class ResolvedTool:
     """A resolved tool with exact version and metadata."""
@@ -45,13 +59,8 @@ class Lockfile:
         """Create a lockfile from a config."""
         from provide.foundation.time import provide_now
 
-        # Calculate config checksum
-        config_dict = config.to_dict()
-        config_str = str(sorted(config_dict.items()))
-        config_checksum = hashlib.sha256(config_str.encode()).hexdigest()[:12]
-
         return cls(
-            config_checksum=config_checksum,
+            config_checksum=_compute_config_checksum(config),
             created_at=provide_now().isoformat(),
         )
 
@@ -87,51 +96,25 @@ class Lockfile:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return {
-            "config_checksum": self.config_checksum,
-            "created_at": self.created_at,
-            "wrknv_version": self.wrknv_version,
-            "resolved_tools": {
-                name: {
-                    "name": tool.name,
-                    "version": tool.version,
-                    "resolved_from": tool.resolved_from,
-                    "checksum": tool.checksum,
-                    "installed_at": tool.installed_at,
-                    "install_path": tool.install_path,
-                }
-                for name, tool in self.resolved_tools.items()
-            },
-        }
+        return cattrs.unstructure(self)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Lockfile:
         """Create from dictionary."""
-        resolved_tools = {}
-        for name, tool_data in data.get("resolved_tools", {}).items():
-            resolved_tools[name] = ResolvedTool(
-                name=tool_data["name"],
-                version=tool_data["version"],
-                resolved_from=tool_data["resolved_from"],
-                checksum=tool_data.get("checksum"),
-                installed_at=tool_data.get("installed_at"),
-                install_path=tool_data.get("install_path"),
-            )
-
-        return cls(
-            config_checksum=data["config_checksum"],
-            resolved_tools=resolved_tools,
-            created_at=data.get("created_at"),
-            wrknv_version=data.get("wrknv_version", "0.3.0"),
-        )
+        # Lockfiles written before the version field existed default to
+        # the release that introduced the format, not the running version.
+        data = {"wrknv_version": "0.3.0", **data}
+        return cattrs.structure(data, cls)
 
 
 class LockfileManager:
     """Manages wrknv.lock files."""
 
-    def __init__(self, project_dir: Path = Path.cwd()) -> None:
-        self.project_dir = project_dir
-        self.lockfile_path = project_dir / "wrknv.lock"
+    def __init__(self, project_dir: Path | None = None) -> None:
+        # Resolved per instance: a default of Path.cwd() in the signature
+        # would freeze the working directory from import time.
+        self.project_dir = project_dir or Path.cwd()
+        self.lockfile_path = self.project_dir / "wrknv.lock"
 
     def load_lockfile(self) -> Lockfile | None:
         """Load existing lockfile."""
@@ -144,16 +127,22 @@ class LockfileManager:
             with self.lockfile_path.open() as f:
                 data = json.load(f)
             return Lockfile.from_dict(data)
-        except (json.JSONDecodeError, KeyError, TypeError):
+        except (json.JSONDecodeError, KeyError, TypeError, cattrs.BaseValidationError):
             # Corrupted lockfile - return None to regenerate
             return None
 
     def save_lockfile(self, lockfile: Lockfile) -> None:
-        """Save lockfile to disk."""
+        """Save lockfile to disk atomically.
+
+        Serializes in memory and writes via temp-file-plus-rename so a
+        crash mid-save can never leave a truncated wrknv.lock behind
+        (which load_lockfile would discard, forcing a full re-resolve).
+        """
         import json
 
-        with self.lockfile_path.open("w") as f:
-            json.dump(lockfile.to_dict(), f, indent=2)
+        from provide.foundation.file import atomic_write_text
+
+        atomic_write_text(self.lockfile_path, json.dumps(lockfile.to_dict(), indent=2))
 
     def create_lockfile(self, config: WorkenvConfig) -> Lockfile:
         """Create a new lockfile from config."""
@@ -165,12 +154,19 @@ class LockfileManager:
         if not lockfile:
             return False
 
-        # Check config checksum
-        current_lockfile = self.create_lockfile(config)
-        return lockfile.config_checksum == current_lockfile.config_checksum
+        # Compare checksums without building a throwaway Lockfile
+        return lockfile.config_checksum == _compute_config_checksum(config)
 
     def resolve_and_lock(self, config: WorkenvConfig) -> Lockfile:
-        """Resolve tool versions and create/update lockfile."""
+        """Resolve tool versions and create/update lockfile.
+
+        Each tool resolution costs at least one HTTP round-trip to a
+        release index, and the tools are independent, so they resolve
+        concurrently. Concurrency is capped to stay friendly to GitHub's
+        unauthenticated rate limit.
+        """
+        import asyncio
+
         from wrknv.managers.factory import get_tool_manager
         from wrknv.utils.version_resolver import resolve_tool_versions
 
@@ -179,33 +175,47 @@ class LockfileManager:
         if not lockfile or not self.is_lockfile_valid(config):
             lockfile = self.create_lockfile(config)
 
-        # Resolve each tool
         tools = config.get_all_tools()
-        for tool_name, version_pattern in tools.items():
-            try:
-                manager = get_tool_manager(tool_name, config)
-
-                # Handle matrix format (list of versions)
-                if isinstance(version_pattern, list):
-                    resolved_versions = resolve_tool_versions(manager, version_pattern)
-                    for resolved_version in resolved_versions:
-                        lockfile.add_resolved_tool(
-                            name=f"{tool_name}@{resolved_version}",
-                            version=resolved_version,
-                            resolved_from=str(version_pattern),
-                        )
-                else:
-                    # Single version pattern
-                    resolved_versions = resolve_tool_versions(manager, version_pattern)
-                    if resolved_versions:
-                        resolved_version = resolved_versions[0]
-                        lockfile.add_resolved_tool(
-                            name=tool_name, version=resolved_version, resolved_from=version_pattern
-                        )
-            except Exception:
-                # nosec B112 - Skip tools that can't be resolved
+
+        def resolve_one(tool_name: str, version_pattern: str | list[str]) -> list[str]:
+            # Runs in a worker thread: managers may spin up their own
+            # event loop internally, so they cannot run on ours.
+            manager = get_tool_manager(tool_name, config)
+            return resolve_tool_versions(manager, version_pattern)
+
+        async def resolve_all() -> list[list[str] | BaseException]:
+            semaphore = asyncio.Semaphore(4)
+
+            async def bounded(tool_name: str, pattern: str | list[str]) -> list[str]:
+                async with semaphore:
+                    return await asyncio.to_thread(resolve_one, tool_name, pattern)
+
+            return await asyncio.gather(
+                *(bounded(name, pattern) for name, pattern in tools.items()),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(resolve_all())
+
+        for (tool_name, version_pattern), resolved_versions in zip(tools.items(), results, strict=True):
+            if isinstance(resolved_versions, BaseException):
+                # Skip tools that can't be resolved
                 continue
 
+            # Handle matrix format (list of versions)
+            if isinstance(version_pattern, list):
+                for resolved_version in resolved_versions:
+                    lockfile.add_resolved_tool(
+                        name=f"{tool_name}@{resolved_version}",
+                        version=resolved_version,
+                        resolved_from=str(version_pattern),
+                    )
+            elif resolved_versions:
+                # Single version pattern
+                lockfile.add_resolved_tool(
+                    name=tool_name, version=resolved_versions[0], resolved_from=version_pattern
+                )
+
         # Save lockfile
         self.save_lockfile(lockfile)
         return lockfile
@@ -5,17 +5,38 @@
 
 """wrknv Tool Managers
 ====================
-Tool managers for different development tools."""
+Tool managers for different development tools.
+
+Manager classes are imported lazily (PEP 562): each one drags in
+transport, platform detection, and release-client machinery, so a CLI
+invocation that touches a single tool should not pay for the rest at
+import time.
+"""
 
 from __future__ import annotations
 
-from wrknv.managers.bao import BaoManager
-from wrknv.managers.base import BaseToolManager, ToolManagerError
-from wrknv.managers.factory import get_supported_tools, get_tool_manager
-from wrknv.managers.go import GoManager
-from wrknv.managers.tf.ibm import IbmTfVariant
-from wrknv.managers.tf.tofu import TofuTfVariant
-from wrknv.managers.uv import UvManager
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from wrknv.managers.bao import BaoManager
+    from wrknv.managers.base import BaseToolManager, ToolManagerError
+    from wrknv.managers.factory import get_supported_tools, get_tool_manager
+    from wrknv.managers.go import GoManager
+    from wrknv.managers.tf.ibm import IbmTfVariant
+    from wrknv.managers.tf.tofu import TofuTfVariant
+    from wrknv.managers.uv import UvManager
+
+_LAZY_IMPORTS = {
+    "BaoManager": "wrknv.managers.bao",
+    "BaseToolManager": "wrknv.managers.base",
+    "GoManager": "wrknv.managers.go",
+    "IbmTfVariant": "wrknv.managers.tf.ibm",
+    "TofuTfVariant": "wrknv.managers.tf.tofu",
+    "ToolManagerError": "wrknv.managers.base",
+    "UvManager": "wrknv.managers.uv",
+    "get_supported_tools": "wrknv.managers.factory",
+    "get_tool_manager": "wrknv.managers.factory",
+}
 
 __all__ = [
     "BaoManager",
@@ -29,4 +50,18 @@ __all__ = [
     "get_tool_manager",
 ]
 
+
+def __getattr__(name: str) -> Any:
+    """Resolve re-exported names on first access and cache them."""
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
 # 🧰🌍🔚
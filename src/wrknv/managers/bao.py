@@ -10,10 +10,12 @@ Manages OpenBao (open source Vault fork) versions for development."""
 from __future__ import annotations
 
 import asyncio
+from functools import cached_property
 import pathlib
 from typing import TYPE_CHECKING
 
 from provide.foundation import logger
+from provide.foundation.file import safe_copy, safe_rmtree
 
 from wrknv.managers.base import BaseToolManager, ToolManagerError
 from wrknv.managers.github import GitHubReleasesClient
@@ -21,6 +23,11 @@ from wrknv.managers.github import GitHubReleasesClient
 if TYPE_CHECKING:
     from wrknv.config import WorkenvConfig
 
+# OpenBao naming: bao_2.1.0_Darwin_arm64.tar.gz (tar.gz on all platforms,
+# capitalized OS names: Darwin, Linux, Windows)
+_BAO_URL_TMPL = "https://github.com/openbao/openbao/releases/download/v{v}/bao_{v}_{os}_{arch}.tar.gz"
+_BAO_SHA256SUMS_TMPL = "https://github.com/openbao/openbao/releases/download/v{v}/bao_{v}_SHA256SUMS"
+
 
 class BaoManager(BaseToolManager):
     """Manages OpenBao versions using GitHub releases API."""
@@ -61,23 +68,26 @@ class BaoManager(BaseToolManager):
         except Exception as e:
             raise ToolManagerError(f"Failed to fetch OpenBao versions: {e}") from e
 
-    def get_download_url(self, version: str) -> str:
-        """Get download URL for OpenBao version."""
+    @cached_property
+    def _platform_triple(self) -> tuple[str, str, str]:
+        """(os, arch, capitalized os), probed once per manager.
+
+        The platform cannot change within a process, so resolving a
+        version matrix should not re-detect it per version.
+        """
         platform_info = self.get_platform_info()
         os_name = platform_info["os"]
-        arch = platform_info["arch"]
-
-        # OpenBao uses capitalized OS names: Darwin, Linux, Windows
-        os_capitalized = os_name.capitalize()
+        return os_name, platform_info["arch"], os_name.capitalize()
 
-        # OpenBao naming: bao_2.1.0_Darwin_arm64.tar.gz
-        # Note: They use tar.gz for all platforms
-        return f"https://github.com/openbao/openbao/releases/download/v{version}/bao_{version}_{os_capitalized}_{arch}.tar.gz"
+    def get_download_url(self, version: str) -> str:
+        """Get download URL for OpenBao version."""
+        _, arch, os_capitalized = self._platform_triple
+        return _BAO_URL_TMPL.format(v=version, os=os_capitalized, arch=arch)
 
     def get_checksum_url(self, version: str) -> str | None:
         """Get checksum URL for OpenBao version."""
         # OpenBao provides SHA256SUMS file
-        return f"https://github.com/openbao/openbao/releases/download/v{version}/bao_{version}_SHA256SUMS"
+        return _BAO_SHA256SUMS_TMPL.format(v=version)
 
     def _install_from_archive(self, archive_path: pathlib.Path, version: str) -> None:
         """Install OpenBao from downloaded archive."""
@@ -96,20 +106,23 @@ class BaoManager(BaseToolManager):
         try:
             self.extract_archive(archive_path, extract_dir)
 
-            # Find bao binary in extracted files
-            bao_binary = None
-            for file_path in extract_dir.rglob("bao*"):
-                if file_path.is_file() and file_path.name in ["bao", "bao.exe"]:
-                    bao_binary = file_path
-                    break
+            # OpenBao archives are flat: the binary sits at the archive
+            # root, so probe it directly instead of walking the tree.
+            candidates = (extract_dir / "bao", extract_dir / "bao.exe")
+            bao_binary = next((p for p in candidates if p.is_file()), None)
+
+            if bao_binary is None:
+                # Defensive fallback in case a future archive nests it
+                bao_binary = next(
+                    (p for p in extract_dir.rglob("bao*") if p.is_file() and p.name in ("bao", "bao.exe")),
+                    None,
+                )
 
             if not bao_binary:
                 raise ToolManagerError("OpenBao binary not found in archive")
 
             # Copy to bin directory
             target_path = bin_dir / bao_binary.name
-            from provide.foundation.file import safe_copy, safe_rmtree
-
             safe_copy(bao_binary, target_path, overwrite=True)
 
             # Make executable (Unix systems)
@@ -123,8 +136,6 @@ class BaoManager(BaseToolManager):
 
         finally:
             # Clean up extraction directory
-            from provide.foundation.file import safe_copy, safe_rmtree
-
             safe_rmtree(extract_dir, missing_ok=True)
 
     def verify_installation(self, version: str) -> bool:
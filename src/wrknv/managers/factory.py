@@ -13,61 +13,47 @@ from wrknv.config import WorkenvConfig
 
 from .base import BaseToolManager
 
-
-def get_tool_manager(tool_name: str, config: WorkenvConfig | None = None) -> BaseToolManager | None:
-    """Get appropriate tool manager for a tool."""
-
-    if config is None:
-        config = WorkenvConfig.load()
-
+# Tool name -> (module, class). Add new tools here; modules are imported
+# on first request for that tool and the resolved class is memoized below.
+_MANAGER_REGISTRY: dict[str, tuple[str, str]] = {
     # Terraform ecosystem
-    if tool_name == "ibmtf":
-        from .tf.ibm import IbmTfVariant
-
-        return IbmTfVariant(config)
-
-    elif tool_name == "tofu":
-        from .tf.tofu import TofuTfVariant
-
-        return TofuTfVariant(config)
-
+    "ibmtf": ("wrknv.managers.tf.ibm", "IbmTfVariant"),
+    "tofu": ("wrknv.managers.tf.tofu", "TofuTfVariant"),
     # Secret management (sub rosa)
-    elif tool_name == "bao":
-        from .subrosa.bao import BaoVariant
-
-        return BaoVariant(config)
+    "bao": ("wrknv.managers.subrosa.bao", "BaoVariant"),
+    "vault": ("wrknv.managers.subrosa.ibm", "IbmVaultVariant"),
+    # Single-variant tools
+    "uv": ("wrknv.managers.uv", "UvManager"),
+    "go": ("wrknv.managers.go", "GoManager"),
+}
 
-    elif tool_name == "vault":
-        from .subrosa.ibm import IbmVaultVariant
+_resolved_classes: dict[str, type[BaseToolManager]] = {}
 
-        return IbmVaultVariant(config)
 
-    # Single-variant tools
-    elif tool_name == "uv":
-        from .uv import UvManager
+def get_tool_manager(tool_name: str, config: WorkenvConfig | None = None) -> BaseToolManager | None:
+    """Get appropriate tool manager for a tool."""
 
-        return UvManager(config)
+    if config is None:
+        config = WorkenvConfig.load()
 
-    elif tool_name == "go":
-        from .go import GoManager
+    manager_cls = _resolved_classes.get(tool_name)
+    if manager_cls is None:
+        entry = _MANAGER_REGISTRY.get(tool_name)
+        if entry is None:
+            return None
 
-        return GoManager(config)
+        from importlib import import_module
 
-    # Add more tools as needed:
-    # elif tool_name == "python":
-    #     from .python import PythonManager
-    #     return PythonManager(config)
-    #
-    # elif tool_name == "node":
-    #     from .node import NodeManager
-    #     return NodeManager(config)
+        module_path, class_name = entry
+        manager_cls = getattr(import_module(module_path), class_name)
+        _resolved_classes[tool_name] = manager_cls
 
-    return None
+    return manager_cls(config)
 
 
 def get_supported_tools() -> list[str]:
     """Get list of supported tools."""
-    return ["ibmtf", "tofu", "bao", "vault", "uv", "go"]
+    return list(_MANAGER_REGISTRY)
 
 
 def get_major_tools() -> list[str]:
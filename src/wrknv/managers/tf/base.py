@@ -14,6 +14,7 @@ from __future__ import annotations
 from abc import abstractmethod
 import os
 import pathlib
+import sys
 from typing import TYPE_CHECKING
 
 from provide.foundation import logger
@@ -24,7 +25,7 @@ from wrknv.managers.base import BaseToolManager, ToolManagerError
 from wrknv.managers.tf.bin_ops import copy_tf_binaries_to_workenv
 from wrknv.managers.tf.metadata import TfMetadataManager
 from wrknv.managers.tf.utils import (
-    calculate_file_hash,
+    calculate_file_hash_and_size,
     get_tool_version_key,
     version_sort_key,
 )
@@ -52,14 +53,28 @@ class TfManager(BaseToolManager):
         # Get workenv bin directory for copying active binaries
         self.workenv_bin_dir = get_workenv_bin_dir(config)
 
-        # Metadata manager
+        # Metadata manager; the metadata.json read is deferred until the
+        # first access of self.metadata, so commands that never touch
+        # metadata skip the load entirely.
         self.metadata_manager = TfMetadataManager(self.install_path, self.tool_name)
-        self.metadata_manager.load_metadata()
-
-        # Expose metadata for backward compatibility
-        self.metadata = self.metadata_manager.metadata
         self.metadata_file = self.metadata_manager.metadata_file
 
+        # Hot-path strings, built once. The interned prefix makes the
+        # frequent metadata dict lookups on version keys hit CPython's
+        # fast identity path.
+        self._prefix_underscore = sys.intern(f"{self.tool_prefix}_")
+        self._tool_version_key = get_tool_version_key(self.tool_name)
+        self._install_path_str = str(self.install_path)
+
+    @property
+    def metadata(self) -> dict:
+        """Metadata dict, loaded lazily by the metadata manager."""
+        return self.metadata_manager.metadata
+
+    @metadata.setter
+    def metadata(self, value: dict) -> None:
+        self.metadata_manager.metadata = value
+
     @property
     @abstractmethod
     def tool_prefix(self) -> str:
@@ -79,23 +94,31 @@ class TfManager(BaseToolManager):
         installed_versions = self.get_installed_versions()
         self.metadata_manager.update_recent_file_with_active(version, installed_versions)
 
+    def _version_key(self, version: str) -> str:
+        """Filename/metadata key for a version (prefix_version)."""
+        return self._prefix_underscore + version
+
     def get_binary_path(self, version: str) -> pathlib.Path:
         """Get path to the installed binary for a version."""
         # In tf versions format, binaries are stored as prefix_version
-        binary_name = f"{self.tool_prefix}_{version}"
-        return self.install_path / binary_name
+        return self.install_path / self._version_key(version)
 
     def get_installed_versions(self) -> list[str]:
         """Get all installed versions of this tool."""
         versions = []
 
-        prefix = f"{self.tool_prefix}_"
-        for item in self.install_path.iterdir():
-            if item.is_file() and item.name.startswith(prefix):
-                # Extract version from filename
-                version = item.name[len(prefix) :]
-                if self._is_version_dir(version):
-                    versions.append(version)
+        prefix = self._prefix_underscore
+        prefix_len = len(prefix)
+        # scandir reuses the file-type info from the directory read
+        # instead of stat-ing a fresh Path object per entry.
+        with os.scandir(self.install_path) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith(prefix) and entry.is_file():
+                    # Extract version from filename
+                    version = name[prefix_len:]
+                    if self._is_version_dir(version):
+                        versions.append(version)
 
         return sorted(versions, key=version_sort_key, reverse=True)
 
@@ -107,10 +130,9 @@ class TfManager(BaseToolManager):
         # Check metadata for active version in workenv
         if "workenv" in self.metadata:
             profile_data = self.metadata["workenv"].get(profile, {})
-            tool_key = get_tool_version_key(self.tool_name)
 
-            if tool_key in profile_data:
-                return profile_data[tool_key]
+            if self._tool_version_key in profile_data:
+                return profile_data[self._tool_version_key]
 
         # No fallbacks - workenv is completely self-contained
         return None
@@ -127,8 +149,7 @@ class TfManager(BaseToolManager):
             self.metadata["workenv"][profile] = {}
 
         # Store active version in metadata under workenv profile
-        tool_key = get_tool_version_key(self.tool_name)
-        self.metadata["workenv"][profile][tool_key] = version
+        self.metadata["workenv"][profile][self._tool_version_key] = version
         self._save_metadata()
 
         # Also ensure it's at the front of RECENT
@@ -147,7 +168,7 @@ class TfManager(BaseToolManager):
             logger.info(f"Removed {self.tool_name} {version}")
 
             # Update metadata
-            version_key = f"{self.tool_prefix}_{version}"
+            version_key = self._version_key(version)
             if version_key in self.metadata:
                 del self.metadata[version_key]
                 self._save_metadata()
@@ -165,7 +186,7 @@ class TfManager(BaseToolManager):
     def _install_from_archive(self, archive_path: pathlib.Path, version: str) -> None:
         """Install tool from downloaded archive in tf versions format."""
         # Extract to temporary directory
-        extract_dir = self.cache_dir / f"{self.tool_prefix}_{version}_extract"
+        extract_dir = self.cache_dir / f"{self._version_key(version)}_extract"
         extract_dir.mkdir(exist_ok=True)
 
         try:
@@ -181,14 +202,23 @@ class TfManager(BaseToolManager):
             else:
                 archive_binary_name = self.executable_name
 
-            binary_path = None
-            for file_path in extract_dir.rglob(f"{archive_binary_name}*"):
-                if file_path.is_file() and file_path.name in [
-                    archive_binary_name,
-                    f"{archive_binary_name}.exe",
-                ]:
-                    binary_path = file_path
-                    break
+            # Terraform/OpenTofu zips are flat, so the binary sits at the
+            # extraction root; probe it directly before falling back to a
+            # full tree walk for unexpectedly nested archives.
+            wanted_names = {archive_binary_name, f"{archive_binary_name}.exe"}
+            binary_path = next(
+                (p for name in wanted_names if (p := extract_dir / name).is_file()),
+                None,
+            )
+            if binary_path is None:
+                binary_path = next(
+                    (
+                        p
+                        for p in extract_dir.rglob(f"{archive_binary_name}*")
+                        if p.is_file() and p.name in wanted_names
+                    ),
+                    None,
+                )
 
             if not binary_path:
                 raise ToolManagerError(
@@ -204,11 +234,11 @@ class TfManager(BaseToolManager):
 
             logger.info(f"Installed {self.tool_name} binary to: {target_path}")
 
-            # Calculate installed binary hash
-            binary_hash = calculate_file_hash(target_path)
+            # Calculate installed binary hash and size in one read pass
+            binary_hash, binary_size = calculate_file_hash_and_size(target_path)
 
             # Update metadata with comprehensive information
-            self._update_install_metadata(version, archive_path, binary_hash)
+            self._update_install_metadata(version, archive_path, binary_hash, binary_size)
 
             # Update RECENT file
             self._update_recent_file()
@@ -221,27 +251,34 @@ class TfManager(BaseToolManager):
             # Clean up extraction directory
             safe_rmtree(extract_dir, missing_ok=True)
 
-    def _update_install_metadata(self, version: str, archive_path: pathlib.Path, binary_hash: str) -> None:
+    def _update_install_metadata(
+        self, version: str, archive_path: pathlib.Path, binary_hash: str, binary_size: int
+    ) -> None:
         """Update metadata for installed version with comprehensive information."""
-        version_key = f"{self.tool_prefix}_{version}"
+        version_key = self._version_key(version)
 
         # Get download URL for source tracking
         download_url = self.get_download_url(version)
         checksum_url = self.get_checksum_url(version)
 
-        # Get file size
-        binary_path = self.get_binary_path(version)
-        file_size = binary_path.stat().st_size if binary_path.exists() else 0
-
-        # Look for signature files
-        sig_patterns = [
-            f"{self.tool_prefix}_*.asc",
-            f"{self.tool_prefix}_*SHA256SUMS.sig",
-            f"{self.tool_name}_*.asc",
-        ]
+        # Metadata stores plain strings, so join them directly instead
+        # of allocating Path objects that are immediately stringified.
+        binary_path_str = os.path.join(self._install_path_str, version_key)
+
+        # Look for signature files in one directory read instead of one
+        # glob pass per pattern.
+        prefix = self._prefix_underscore
+        name_prefix = f"{self.tool_name}_"
         signature_files = []
-        for pattern in sig_patterns:
-            signature_files.extend(self.install_path.glob(pattern))
+        with os.scandir(self.install_path) as entries:
+            for entry in entries:
+                name = entry.name
+                if not entry.is_file():
+                    continue
+                if (name.startswith(prefix) and (name.endswith(".asc") or name.endswith("SHA256SUMS.sig"))) or (
+                    name.startswith(name_prefix) and name.endswith(".asc")
+                ):
+                    signature_files.append(os.path.join(self._install_path_str, name))
 
         self.metadata[version_key] = {
             "tool": self.tool_name,
@@ -251,10 +288,10 @@ class TfManager(BaseToolManager):
             "checksum_url": checksum_url if checksum_url else None,
             "archive_path": str(archive_path),
             "archive_size": archive_path.stat().st_size if archive_path.exists() else 0,
-            "binary_path": str(binary_path),
-            "binary_size": file_size,
+            "binary_path": binary_path_str,
+            "binary_size": binary_size,
             "binary_sha256": binary_hash,
-            "signature_files": [str(f) for f in signature_files],
+            "signature_files": signature_files,
             "platform": self.get_platform_info(),
             "wrknv_version": "0.3.0",  # Track which version of wrknv installed this
         }
@@ -311,9 +348,7 @@ class TfManager(BaseToolManager):
         if "global" not in self.metadata:
             self.metadata["global"] = {}
 
-        tool_key = "opentofu_version" if self.tool_name == "tofu" else f"{self.tool_name}_version"
-
-        self.metadata["global"][tool_key] = version
+        self.metadata["global"][self._tool_version_key] = version
         self._save_metadata()
 
         logger.info(f"Set {self.tool_name} {version} as global system version at {target_path}")
@@ -323,13 +358,37 @@ class TfManager(BaseToolManager):
         if "global" not in self.metadata:
             return None
 
-        tool_key = "opentofu_version" if self.tool_name == "tofu" else f"{self.tool_name}_version"
+        return self.metadata["global"].get(self._tool_version_key)
 
-        return self.metadata["global"].get(tool_key)
+    def _is_verified(self, version: str) -> bool:
+        """True if this version's binary already passed a live version probe.
+
+        Lets verify_installation skip its fork+exec — by far the slowest
+        step when switching across many versions — for binaries whose
+        hash was recorded as known-good.
+        """
+        info = self.get_metadata_for_version(version)
+        if not info:
+            return False
+
+        sha = info.get("binary_sha256")
+        return bool(sha) and sha in self.metadata.get("verified_sha256", [])
+
+    def _mark_verified(self, version: str) -> None:
+        """Record this version's binary hash as known-good."""
+        info = self.get_metadata_for_version(version)
+        sha = info.get("binary_sha256") if info else None
+        if not sha:
+            return
+
+        verified = self.metadata.setdefault("verified_sha256", [])
+        if sha not in verified:
+            verified.append(sha)
+            self._save_metadata()
 
     def get_metadata_for_version(self, version: str) -> dict | None:
         """Get metadata for a specific version."""
-        version_key = f"{self.tool_prefix}_{version}"
+        version_key = self._version_key(version)
         return self.metadata.get(version_key)
 
     def get_active_version_info(self) -> dict | None:
@@ -361,7 +420,7 @@ class TfManager(BaseToolManager):
 
     def _copy_active_binaries_to_venv(self) -> None:
         """Copy all active tf binaries to workenv bin directory."""
-        copy_tf_binaries_to_workenv(self.workenv_bin_dir, self.config)
+        copy_tf_binaries_to_workenv(self.workenv_bin_dir, self.config, managers={self.tool_name: self})
 
     def switch_version(self, version: str, dry_run: bool = False) -> None:
         """Switch to a specific version (like nvm use, tfswitch).
@@ -382,13 +441,15 @@ class TfManager(BaseToolManager):
                 logger.info(f"[DRY-RUN] Would install {self.tool_name} {version}")
             return
 
-        # 1. Install if not present
-        if not self.get_binary_path(version).exists():
-            logger.info(f"Installing {self.tool_name} {version}...")
-            self.install_version(version, dry_run=False)
+        # 1 & 2 both update metadata; coalesce their saves into one write
+        with self.metadata_manager.defer_saves():
+            # 1. Install if not present
+            if not self.get_binary_path(version).exists():
+                logger.info(f"Installing {self.tool_name} {version}...")
+                self.install_version(version, dry_run=False)
 
-        # 2. Activate in workenv (copies binaries to venv bin)
-        self.create_symlink(version)
+            # 2. Activate in workenv (copies binaries to venv bin)
+            self.create_symlink(version)
 
         # 3. Regenerate env script
         try:
@@ -18,31 +18,43 @@ from wrknv.wenv.bin_manager import copy_tool_binary
 
 if TYPE_CHECKING:
     from wrknv.config import WorkenvConfig
+    from wrknv.managers.tf.base import TfManager
 
 
-def copy_tf_binaries_to_workenv(bin_dir: pathlib.Path, config: WorkenvConfig | None) -> None:
+def copy_tf_binaries_to_workenv(
+    bin_dir: pathlib.Path,
+    config: WorkenvConfig | None,
+    managers: dict[str, TfManager] | None = None,
+) -> None:
     """Copy all active tf binaries to workenv bin directory.
 
     Args:
         bin_dir: Target bin directory
         config: Workenv configuration
+        managers: Already-constructed managers keyed by tool name; any
+            variant not supplied is constructed on demand. Callers that
+            are themselves a variant pass self to skip a redundant
+            construction (and its metadata load).
     """
     if not bin_dir:
         logger.warning("No bin directory available for tf binary copying")
         return
 
+    managers = managers or {}
+
     # Get active versions for both tf variants
     for tool_name in ["tofu", "ibmtf"]:
         try:
-            # Create a temporary manager instance to get active version
-            if tool_name == "tofu":
-                from wrknv.managers.tf.tofu import TofuTfVariant
+            temp_manager = managers.get(tool_name)
+            if temp_manager is None:
+                if tool_name == "tofu":
+                    from wrknv.managers.tf.tofu import TofuTfVariant
 
-                temp_manager = TofuTfVariant(config)
-            else:
-                from wrknv.managers.tf.ibm import IbmTfVariant
+                    temp_manager = TofuTfVariant(config)
+                else:
+                    from wrknv.managers.tf.ibm import IbmTfVariant
 
-                temp_manager = IbmTfVariant(config)
+                    temp_manager = IbmTfVariant(config)
 
             active_version = temp_manager.get_installed_version()
             if active_version:
@@ -10,6 +10,7 @@ Manages IBM Terraform (formerly HashiCorp Terraform) versions for development en
 from __future__ import annotations
 
 import asyncio
+from functools import cached_property
 import re
 
 from provide.foundation.logger import get_logger
@@ -21,6 +22,9 @@ from wrknv.managers.tf.utils import version_sort_key
 
 logger = get_logger(__name__)
 
+# Compiled once: checked against every entry in the releases index.
+_PRERELEASE_RE = re.compile(r"alpha|beta|rc|pre", re.IGNORECASE)
+
 
 class IbmTfVariant(TfManager):
     """IBM Terraform variant - manages IBM Terraform (formerly HashiCorp Terraform) versions using HashiCorp's releases API."""
@@ -37,28 +41,47 @@ class IbmTfVariant(TfManager):
     def tool_prefix(self) -> str:
         return "terraform"
 
+    @cached_property
+    def _mirror_url(self) -> str:
+        """Release mirror base URL, resolved from config once per manager."""
+        mirror_url: str = self.config.get_setting(
+            "terraform_mirror", "https://releases.hashicorp.com/terraform"
+        )
+        return mirror_url.rstrip("/")
+
+    @cached_property
+    def _platform_pair(self) -> tuple[str, str]:
+        """(os, arch), probed once: the platform cannot change mid-process."""
+        platform_info = self.get_platform_info()
+        return platform_info["os"], platform_info["arch"]
+
     def get_available_versions(self) -> list[str]:
         """Get available IBM Terraform versions from HashiCorp releases API."""
         try:
-            # Use custom mirror if configured
-            mirror_url = self.config.get_setting(
-                "terraform_mirror", "https://releases.hashicorp.com/terraform"
-            )
-            api_url = f"{mirror_url.rstrip('/')}/index.json"
+            api_url = f"{self._mirror_url}/index.json"
 
             logger.debug(f"Fetching IBM Terraform versions from {api_url}")
 
             response = asyncio.run(get(api_url))
             data = response.json()
 
-            versions = []
-            for version_info in data.get("versions", {}).values():
-                version = version_info.get("version")
-                if version and not self._is_prerelease(version):
-                    versions.append(version)
-
-            # Sort versions in descending order (latest first)
-            versions.sort(key=version_sort_key, reverse=True)
+            # Hoisted out of the per-version filter: one config lookup
+            # for the whole index instead of one per entry.
+            include_prereleases = self.config.get_setting("include_prereleases", False)
+
+            # Build the keyed entries straight off the parsed index so
+            # the only list held alongside the parse tree is the final
+            # one, then drop the tree before sorting. Decorate-sort-
+            # undecorate keys each of the hundreds of entries once.
+            keyed = [
+                (version_sort_key(version), version)
+                for version_info in data.get("versions", {}).values()
+                if (version := version_info.get("version"))
+                and (include_prereleases or _PRERELEASE_RE.search(version) is None)
+            ]
+            del data
+            keyed.sort(reverse=True)
+            versions = [v for _, v in keyed]
 
             logger.debug(f"Found {len(versions)} IBM Terraform versions")
             # Log the first few versions to debug
@@ -72,30 +95,19 @@ class IbmTfVariant(TfManager):
 
     def _is_prerelease(self, version: str) -> bool:
         """Check if version is a prerelease."""
-        include_prereleases = self.config.get_setting("include_prereleases", False)
-        if include_prereleases:
+        if self.config.get_setting("include_prereleases", False):
             return False
 
-        # Check for prerelease indicators
-        prerelease_patterns = ["alpha", "beta", "rc", "pre"]
-        version_lower = version.lower()
-        return any(pattern in version_lower for pattern in prerelease_patterns)
+        return _PRERELEASE_RE.search(version) is not None
 
     def get_download_url(self, version: str) -> str:
         """Get download URL for IBM Terraform version."""
-        platform_info = self.get_platform_info()
-        os_name = platform_info["os"]
-        arch = platform_info["arch"]
-
-        # Use custom mirror if configured
-        mirror_url = self.config.get_setting("terraform_mirror", "https://releases.hashicorp.com/terraform")
-
-        return f"{mirror_url.rstrip('/')}/{version}/terraform_{version}_{os_name}_{arch}.zip"
+        os_name, arch = self._platform_pair
+        return f"{self._mirror_url}/{version}/terraform_{version}_{os_name}_{arch}.zip"
 
     def get_checksum_url(self, version: str) -> str | None:
         """Get checksum URL for IBM Terraform version."""
-        mirror_url = self.config.get_setting("terraform_mirror", "https://releases.hashicorp.com/terraform")
-        return f"{mirror_url.rstrip('/')}/{version}/terraform_{version}_SHA256SUMS"
+        return f"{self._mirror_url}/{version}/terraform_{version}_SHA256SUMS"
 
     # _install_from_archive is inherited from TfVersionsManager
 
@@ -106,6 +118,10 @@ class IbmTfVariant(TfManager):
             logger.error(f"IBM Terraform binary not found at {binary_path}")
             return False
 
+        if self._is_verified(version):
+            logger.debug(f"IBM Terraform {version} already verified, skipping version probe")
+            return True
+
         try:
             from provide.foundation.process import run
 
@@ -121,6 +137,7 @@ class IbmTfVariant(TfManager):
                 version_pattern = rf"Terraform v{re.escape(version)}"
                 if re.search(version_pattern, result.stdout):
                     logger.debug(f"IBM Terraform {version} verification successful")
+                    self._mark_verified(version)
                     return True
                 else:
                     logger.error(f"Version mismatch in IBM Terraform output: {result.stdout}")
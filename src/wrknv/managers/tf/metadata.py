@@ -9,11 +9,20 @@ Metadata and RECENT file management for Terraform/OpenTofu managers."""
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+import contextlib
 import json
+import os
 import pathlib
 
 from provide.foundation import logger
 
+from wrknv.managers.tf.utils import get_tool_key, get_tool_version_key
+
+# Bump when the on-disk metadata layout changes; files stamped with the
+# current version skip the legacy-key migration scan on load.
+_SCHEMA_VERSION = 2
+
 
 class TfMetadataManager:
     """Manages metadata and RECENT files for tf tools."""
@@ -22,25 +31,48 @@ class TfMetadataManager:
         self.install_path = install_path
         self.tool_name = tool_name
         self.metadata_file = install_path / "metadata.json"
-        self.metadata: dict = {}
+        self._tool_key = get_tool_key(tool_name)
+        self._metadata: dict | None = None
+        self._last_serialized: str | None = None
+        self._saves_deferred = False
+        self._save_pending = False
+        self._recent_cache: dict | None = None
+
+    @property
+    def metadata(self) -> dict:
+        """Metadata mapping, read from disk on first access.
+
+        Deferring the JSON load keeps commands that never touch
+        metadata (version listings, path lookups) off the disk.
+        """
+        if self._metadata is None:
+            self.load_metadata()
+        return self._metadata  # type: ignore[return-value]
+
+    @metadata.setter
+    def metadata(self, value: dict) -> None:
+        self._metadata = value
 
     def load_metadata(self) -> None:
         """Load metadata from JSON file."""
         if self.metadata_file.exists():
             try:
                 with self.metadata_file.open() as f:
-                    self.metadata = json.load(f)
+                    self._metadata = json.load(f)
                 # Migrate old format if needed
                 self._migrate_metadata_format()
             except Exception as e:
                 logger.warning(f"Failed to load metadata: {e}")
-                self.metadata = {}
+                self._metadata = {"_schema_version": _SCHEMA_VERSION}
         else:
-            self.metadata = {}
+            # Fresh installs start at the current schema: nothing to scan.
+            self._metadata = {"_schema_version": _SCHEMA_VERSION}
 
     def _migrate_metadata_format(self) -> None:
         """Migrate old metadata format to new workenv structure."""
-        needs_save = False
+        # Already stamped as current — skip the legacy-key scan.
+        if self.metadata.get("_schema_version", 1) >= _SCHEMA_VERSION:
+            return
 
         # Migrate old active_* keys to workenv structure
         for old_key in ["active_tofu", "active_terraform"]:
@@ -55,38 +87,86 @@ class TfMetadataManager:
                     self.metadata["workenv"]["default"] = {}
 
                 # Set version in new structure
-                # Use 'opentofu_version' for tofu
-                version_key = "opentofu_version" if tool == "tofu" else f"{tool}_version"
+                version_key = get_tool_version_key(tool)
 
                 self.metadata["workenv"]["default"][version_key] = version
-                needs_save = True
 
-        if needs_save:
-            self.save_metadata()
+        # Stamp the file so later loads take the early return above:
+        # legacy files pay for exactly one migration pass and rewrite.
+        self.metadata["_schema_version"] = _SCHEMA_VERSION
+        self.save_metadata()
 
     def save_metadata(self) -> None:
-        """Save metadata to JSON file."""
+        """Save metadata to JSON file atomically, skipping no-op writes."""
+        if self._saves_deferred:
+            self._save_pending = True
+            return
+
         try:
-            with self.metadata_file.open("w") as f:
-                json.dump(self.metadata, f, indent=2, sort_keys=True, default=str)
+            # Compact separators, no key sorting: this file is rewritten
+            # on every install and switch and is only read back by wrknv,
+            # so the indent/sort_keys cost bought nothing.
+            payload = json.dumps(self.metadata, separators=(",", ":"), default=str)
+            if payload == self._last_serialized:
+                return
+
+            # Temp file + rename so a crash mid-write cannot leave a
+            # truncated metadata.json behind.
+            tmp_file = self.metadata_file.with_suffix(".json.tmp")
+            tmp_file.write_text(payload)
+            os.replace(tmp_file, self.metadata_file)
+            self._last_serialized = payload
         except Exception as e:
             logger.warning(f"Failed to save metadata: {e}")
 
-    def update_recent_file(self, installed_versions: list[str]) -> None:
-        """Update the RECENT file with current installed versions."""
-        recent_file = self.install_path / "RECENT"
-        recent_data = {}
+    @contextlib.contextmanager
+    def defer_saves(self) -> Iterator[None]:
+        """Coalesce save_metadata calls inside the block into one write.
 
-        # Read existing RECENT file if it exists
-        if recent_file.exists():
-            try:
-                with recent_file.open() as f:
-                    recent_data = json.load(f)
-            except (json.JSONDecodeError, OSError):
-                recent_data = {}
+        switch_version triggers several saves along the way (install
+        metadata, active version, migrations); under this context they
+        collapse into a single serialization and rename at exit.
+        """
+        if self._saves_deferred:
+            yield
+            return
+
+        self._saves_deferred = True
+        try:
+            yield
+        finally:
+            self._saves_deferred = False
+            if self._save_pending:
+                self._save_pending = False
+                self.save_metadata()
+
+    def _load_recent(self) -> dict:
+        """Parsed RECENT contents, read from disk once per manager.
+
+        set_installed_version and remove_version both touch RECENT; the
+        cache spares each later update a file open and JSON parse.
+        """
+        if self._recent_cache is None:
+            recent_file = self.install_path / "RECENT"
+            recent_data = {}
+            if recent_file.exists():
+                try:
+                    with recent_file.open() as f:
+                        recent_data = json.load(f)
+                except (json.JSONDecodeError, OSError):
+                    recent_data = {}
+            self._recent_cache = recent_data
+        return self._recent_cache
+
+    def _write_recent(self, recent_data: dict) -> None:
+        """Write RECENT contents to disk (callers handle failures)."""
+        with (self.install_path / "RECENT").open("w") as f:
+            json.dump(recent_data, f)
 
-        # Get tool key for RECENT file
-        tool_key = self.tool_name if self.tool_name != "tofu" else "opentofu"
+    def update_recent_file(self, installed_versions: list[str]) -> None:
+        """Update the RECENT file with current installed versions."""
+        recent_data = self._load_recent()
+        tool_key = self._tool_key
 
         if installed_versions:
             # Keep only the 5 most recent versions
@@ -95,41 +175,20 @@ class TfMetadataManager:
             # Remove tool if no versions installed
             del recent_data[tool_key]
 
-        # Write updated RECENT file
         try:
-            with recent_file.open("w") as f:
-                json.dump(recent_data, f)
+            self._write_recent(recent_data)
         except Exception as e:
             logger.warning(f"Failed to update RECENT file: {e}")
 
     def update_recent_file_with_active(self, version: str, installed_versions: list[str]) -> None:
         """Update RECENT file to put active version first."""
-        recent_file = self.install_path / "RECENT"
-        recent_data = {}
-
-        # Read existing RECENT file if it exists
-        if recent_file.exists():
-            try:
-                with recent_file.open() as f:
-                    recent_data = json.load(f)
-            except (json.JSONDecodeError, OSError):
-                recent_data = {}
-
-        # Get tool key
-        tool_key = self.tool_name if self.tool_name != "tofu" else "opentofu"
-
-        # Put active version first, then other recent versions
-        versions_list = [version]
-        for v in installed_versions:
-            if v != version and len(versions_list) < 5:
-                versions_list.append(v)
+        recent_data = self._load_recent()
 
-        recent_data[tool_key] = versions_list
+        # Put active version first, then up to four other recent versions
+        recent_data[self._tool_key] = [version, *[v for v in installed_versions if v != version][:4]]
 
-        # Write updated RECENT file
         try:
-            with recent_file.open("w") as f:
-                json.dump(recent_data, f)
+            self._write_recent(recent_data)
         except Exception as e:
             logger.warning(f"Failed to update RECENT file with active version: {e}")
 
@@ -88,6 +88,10 @@ class TofuTfVariant(TfManager):
             logger.error(f"OpenTofu binary not found at {binary_path}")
             return False
 
+        if self._is_verified(version):
+            logger.debug(f"OpenTofu {version} already verified, skipping version probe")
+            return True
+
         try:
             from provide.foundation.process import run
 
@@ -103,6 +107,7 @@ class TofuTfVariant(TfManager):
                 version_pattern = rf"OpenTofu v{re.escape(version)}"
                 if re.search(version_pattern, result.stdout):
                     logger.debug(f"OpenTofu {version} verification successful")
+                    self._mark_verified(version)
                     return True
                 else:
                     logger.error(f"Version mismatch in OpenTofu output: {result.stdout}")
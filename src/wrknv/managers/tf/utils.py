@@ -9,7 +9,10 @@ Utility functions for Terraform/OpenTofu managers."""
 
 from __future__ import annotations
 
+import functools
 import hashlib
+import mmap
+import os
 import pathlib
 
 import semver
@@ -17,15 +20,37 @@ import semver
 
 def calculate_file_hash(file_path: pathlib.Path, algorithm: str = "sha256") -> str:
     """Calculate hash of a file."""
-    hash_func = hashlib.new(algorithm)
+    return calculate_file_hash_and_size(file_path, algorithm)[0]
+
+
+def calculate_file_hash_and_size(file_path: pathlib.Path, algorithm: str = "sha256") -> tuple[str, int]:
+    """Hash a file and report its size in one pass over one descriptor.
+
+    The file is mmapped and fed to the hash in a single C-level call, so
+    the ~80 MB tf binaries are digested from page cache with the GIL
+    released and no Python-side read loop; file_digest covers the cases
+    mmap cannot (empty files, filesystems without mapping support).
+    fstat on the already-open descriptor replaces a separate stat call
+    for the size.
+    """
     with file_path.open("rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hash_func.update(chunk)
-    return hash_func.hexdigest()
+        size = os.fstat(f.fileno()).st_size
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                digest = hashlib.new(algorithm, mapped).hexdigest()
+        except (ValueError, OSError):
+            digest = hashlib.file_digest(f, algorithm).hexdigest()
+    return digest, size
 
 
+@functools.lru_cache(maxsize=4096)
 def version_sort_key(version: str) -> semver.VersionInfo:
-    """Generate sort key for semantic versioning using semver module."""
+    """Generate sort key for semantic versioning using semver module.
+
+    Memoized: the installed-version and release-index sorts feed the
+    same version strings through here repeatedly, and the tolerant
+    semver parse is the expensive part of those sorts.
+    """
     try:
         # Try to parse as a semantic version
         return semver.VersionInfo.parse(version)
@@ -43,9 +68,26 @@ def version_sort_key(version: str) -> semver.VersionInfo:
             return semver.VersionInfo.parse("0.0.0")
 
 
+# tofu stores under the "opentofu" name in metadata and RECENT files;
+# every other tool stores under its own name. Built once at import so
+# the metadata paths do a dict probe instead of rebuilding the strings
+# (and re-running the tofu special case) on every call.
+TOOL_KEY = {"tofu": "opentofu"}
+TOOL_VERSION_KEY = {
+    "tofu": "opentofu_version",
+    "ibmtf": "ibmtf_version",
+    "terraform": "terraform_version",
+}
+
+
+def get_tool_key(tool_name: str) -> str:
+    """Get the key naming this tool in metadata and RECENT files."""
+    return TOOL_KEY.get(tool_name, tool_name)
+
+
 def get_tool_version_key(tool_name: str) -> str:
     """Get the metadata key for storing tool version."""
-    return "opentofu_version" if tool_name == "tofu" else f"{tool_name}_version"
+    return TOOL_VERSION_KEY.get(tool_name) or f"{tool_name}_version"
 
 
 # 🧰🌍🔚
@@ -9,6 +9,8 @@ Handles resolution of version patterns like "1.11.x" to specific versions."""
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from provide.foundation.logger import get_logger
 import semver
 
@@ -17,6 +19,31 @@ from wrknv.managers.base import BaseToolManager
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _parse_sort_key(version: str) -> semver.VersionInfo:
+    """Parse a version string into a sortable key, tolerantly.
+
+    Cached at module level: a lockfile regeneration sorts the same
+    available-version strings once per pattern per tool, so the repeated
+    semver parses dominate without the cache.
+    """
+    try:
+        # Try to parse as a semantic version
+        return semver.VersionInfo.parse(version)
+    except ValueError:
+        # If it fails, try to make it semver-compliant
+        # Handle versions like "1.0" by adding ".0"
+        parts = version.split(".")
+        while len(parts) < 3:
+            parts.append("0")
+        try:
+            normalized = ".".join(parts[:3])
+            return semver.VersionInfo.parse(normalized)
+        except ValueError:
+            # Last resort: return a very old version
+            return semver.VersionInfo.parse("0.0.0")
+
+
 class VersionResolver:
     """Resolves version patterns to specific versions from available versions list."""
 
@@ -120,21 +147,7 @@ class VersionResolver:
 
     def _version_sort_key(self, version: str) -> semver.VersionInfo:
         """Generate sort key for semantic versioning using semver module."""
-        try:
-            # Try to parse as a semantic version
-            return semver.VersionInfo.parse(version)
-        except ValueError:
-            # If it fails, try to make it semver-compliant
-            # Handle versions like "1.0" by adding ".0"
-            parts = version.split(".")
-            while len(parts) < 3:
-                parts.append("0")
-            try:
-                normalized = ".".join(parts[:3])
-                return semver.VersionInfo.parse(normalized)
-            except ValueError:
-                # Last resort: return a very old version
-                return semver.VersionInfo.parse("0.0.0")
+        return _parse_sort_key(version)
 
     def resolve_versions(self, version_patterns: list[str]) -> list[str]:
         """Resolve multiple version patterns."""
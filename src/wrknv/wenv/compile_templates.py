@@ -0,0 +1,68 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Env Template Precompilation
+===========================
+Ahead-of-time compile the env script templates to Python modules.
+
+The templates under ``templates/env/`` ship with the package and never
+change at runtime, so there is no reason to run the Jinja parser on
+every process that generates an env script. ``python -m
+wrknv.wenv.compile_templates`` writes compiled modules to
+``templates/env/_compiled/{sh,pwsh}/``; when that directory exists the
+generator loads templates through :class:`jinja2.ModuleLoader` and
+skips parsing entirely, falling back to the source templates otherwise.
+Run this after editing any ``.j2`` file."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+# Environment settings here must match _build_environments in
+# env_generator; a compiled template bakes them in.
+_TEMPLATE_SUBDIRS = ("sh", "pwsh")
+
+
+def compile_env_templates(template_base_dir: Path | None = None) -> Path:
+    """Compile every env template under ``template_base_dir``.
+
+    Args:
+        template_base_dir: Template root (defaults to the packaged
+            ``templates/env`` directory)
+
+    Returns:
+        Path to the ``_compiled`` directory that was written
+    """
+    if template_base_dir is None:
+        template_base_dir = Path(__file__).parent.parent / "templates" / "env"
+
+    compiled_root = template_base_dir / "_compiled"
+
+    for subdir in _TEMPLATE_SUBDIRS:
+        env = Environment(
+            loader=FileSystemLoader(template_base_dir / subdir),
+            autoescape=select_autoescape(),
+            trim_blocks=True,
+            lstrip_blocks=True,
+        )
+        target = compiled_root / subdir
+        target.mkdir(parents=True, exist_ok=True)
+        env.compile_templates(str(target), zip=None)
+
+    return compiled_root
+
+
+def main() -> None:
+    """Compile the packaged env templates in place."""
+    compile_env_templates()
+
+
+if __name__ == "__main__":
+    main()
+
+
+# 🧰🌍🔚
@@ -0,0 +1,32 @@
+# Bash completion for wrknv
+
+# Word lists keyed by the preceding word, populated once when the script
+# is sourced; each TAB press is then a single hash probe instead of a
+# case ladder re-tokenizing the same lists.
+declare -A _WRKNV_OPTS=(
+    [wrknv]="setup tf status sync generate-env container profile config package"
+    [setup]="--init --shell-integration --force --check --completions --install --help"
+    [tf]="--latest --list --dry-run --terraform --help"
+    [container]="build start enter stop restart status logs clean rebuild"
+    [profile]="list save load show delete export import"
+    [config]="show edit validate init get set path"
+    [package]="build verify keygen clean init list info sign config"
+    [--completions]="bash zsh fish"
+)
+
+_wrknv_completion() {
+    local cur prev words cword
+    _init_completion || return
+
+    local list="${_WRKNV_OPTS[$prev]}"
+    if [[ -n $list ]]; then
+        COMPREPLY=($(compgen -W "$list" -- "$cur"))
+        return 0
+    fi
+
+    # Everything else (including --manifest/--output/-o/--key values)
+    # falls through to file completion.
+    _filedir
+}
+
+complete -F _wrknv_completion wrknv
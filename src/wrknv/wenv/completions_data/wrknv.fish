@@ -0,0 +1,78 @@
+# Fish completion for wrknv
+
+# Disable file completions by default
+complete -c wrknv -f
+
+# Main commands
+complete -c wrknv -n "__fish_use_subcommand" -a "setup" -d "Set up wrknv environment"
+complete -c wrknv -n "__fish_use_subcommand" -a "tf" -d "Manage Terraform/OpenTofu"
+complete -c wrknv -n "__fish_use_subcommand" -a "status" -d "Show tool status"
+complete -c wrknv -n "__fish_use_subcommand" -a "sync" -d "Install all tools"
+complete -c wrknv -n "__fish_use_subcommand" -a "generate-env" -d "Generate env script"
+complete -c wrknv -n "__fish_use_subcommand" -a "container" -d "Manage containers"
+complete -c wrknv -n "__fish_use_subcommand" -a "profile" -d "Manage profiles"
+complete -c wrknv -n "__fish_use_subcommand" -a "config" -d "Manage configuration"
+complete -c wrknv -n "__fish_use_subcommand" -a "package" -d "Manage packages"
+
+# Setup options
+complete -c wrknv -n "__fish_seen_subcommand_from setup" -l init -d "Initialize workenv"
+complete -c wrknv -n "__fish_seen_subcommand_from setup" -l shell-integration -d "Set up shell aliases"
+complete -c wrknv -n "__fish_seen_subcommand_from setup" -l force -d "Force recreate"
+complete -c wrknv -n "__fish_seen_subcommand_from setup" -l check -d "Check dependencies"
+complete -c wrknv -n "__fish_seen_subcommand_from setup" -l completions -a "bash zsh fish" -d "Generate completions"
+complete -c wrknv -n "__fish_seen_subcommand_from setup" -l install -d "Install completions"
+
+# TF options
+complete -c wrknv -n "__fish_seen_subcommand_from tf" -l latest -d "Install latest version"
+complete -c wrknv -n "__fish_seen_subcommand_from tf" -l list -d "List versions"
+complete -c wrknv -n "__fish_seen_subcommand_from tf" -l dry-run -d "Dry run"
+complete -c wrknv -n "__fish_seen_subcommand_from tf" -l terraform -d "Use Terraform"
+
+# Subcommand guard: true when the command line is exactly
+# `wrknv <parent>`. One count/compare per keystroke, instead of the
+# old seen/not-seen guards that scanned a ten-token list for every
+# candidate line.
+function __wrknv_needs_subcommand
+    set -l words (commandline -opc)
+    test (count $words) -eq 2; and test "$words[2]" = "$argv[1]"
+end
+
+# Container subcommands
+complete -c wrknv -n "__wrknv_needs_subcommand container" -a "build" -d "Build image"
+complete -c wrknv -n "__wrknv_needs_subcommand container" -a "start" -d "Start container"
+complete -c wrknv -n "__wrknv_needs_subcommand container" -a "enter" -d "Enter container"
+complete -c wrknv -n "__wrknv_needs_subcommand container" -a "stop" -d "Stop container"
+complete -c wrknv -n "__wrknv_needs_subcommand container" -a "restart" -d "Restart container"
+complete -c wrknv -n "__wrknv_needs_subcommand container" -a "status" -d "Show status"
+complete -c wrknv -n "__wrknv_needs_subcommand container" -a "logs" -d "Show logs"
+complete -c wrknv -n "__wrknv_needs_subcommand container" -a "clean" -d "Clean resources"
+complete -c wrknv -n "__wrknv_needs_subcommand container" -a "rebuild" -d "Rebuild from scratch"
+
+# Profile subcommands
+complete -c wrknv -n "__wrknv_needs_subcommand profile" -a "list" -d "List profiles"
+complete -c wrknv -n "__wrknv_needs_subcommand profile" -a "save" -d "Save profile"
+complete -c wrknv -n "__wrknv_needs_subcommand profile" -a "load" -d "Load profile"
+complete -c wrknv -n "__wrknv_needs_subcommand profile" -a "show" -d "Show profile"
+complete -c wrknv -n "__wrknv_needs_subcommand profile" -a "delete" -d "Delete profile"
+complete -c wrknv -n "__wrknv_needs_subcommand profile" -a "export" -d "Export profile"
+complete -c wrknv -n "__wrknv_needs_subcommand profile" -a "import" -d "Import profile"
+
+# Config subcommands
+complete -c wrknv -n "__wrknv_needs_subcommand config" -a "show" -d "Show config"
+complete -c wrknv -n "__wrknv_needs_subcommand config" -a "edit" -d "Edit config"
+complete -c wrknv -n "__wrknv_needs_subcommand config" -a "validate" -d "Validate config"
+complete -c wrknv -n "__wrknv_needs_subcommand config" -a "init" -d "Initialize config"
+complete -c wrknv -n "__wrknv_needs_subcommand config" -a "get" -d "Get value"
+complete -c wrknv -n "__wrknv_needs_subcommand config" -a "set" -d "Set value"
+complete -c wrknv -n "__wrknv_needs_subcommand config" -a "path" -d "Show path"
+
+# Package subcommands
+complete -c wrknv -n "__wrknv_needs_subcommand package" -a "build" -d "Build package"
+complete -c wrknv -n "__wrknv_needs_subcommand package" -a "verify" -d "Verify package"
+complete -c wrknv -n "__wrknv_needs_subcommand package" -a "keygen" -d "Generate keys"
+complete -c wrknv -n "__wrknv_needs_subcommand package" -a "clean" -d "Clean cache"
+complete -c wrknv -n "__wrknv_needs_subcommand package" -a "init" -d "Initialize provider"
+complete -c wrknv -n "__wrknv_needs_subcommand package" -a "list" -d "List packages"
+complete -c wrknv -n "__wrknv_needs_subcommand package" -a "info" -d "Show package info"
+complete -c wrknv -n "__wrknv_needs_subcommand package" -a "sign" -d "Sign package"
+complete -c wrknv -n "__wrknv_needs_subcommand package" -a "config" -d "Show config"
@@ -0,0 +1,296 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Shell Completion Codegen
+========================
+Single source of truth for the completion scripts under
+``completions_data/``.
+
+The command and option tables used to be hand-maintained three times,
+once per shell, and drifted accordingly. They now live in ``_SPEC``; the
+emitters below walk it once per shell and ``python -m
+wrknv.wenv.completions_gen`` rewrites the shipped data files. Nothing
+here is imported at runtime — the CLI serves the pre-baked files — and a
+test pins the shipped files to the emitter output."""
+
+from __future__ import annotations
+
+from importlib import resources
+from pathlib import Path
+from typing import Final
+
+# (name, long description, short description). Zsh shows the long form,
+# Fish the short one, Bash only the names.
+_COMMANDS: Final = (
+    ("setup", "Set up wrknv environment and integrations", "Set up wrknv environment"),
+    ("tf", "Install or manage Terraform/OpenTofu versions", "Manage Terraform/OpenTofu"),
+    ("status", "Show status of all managed tools", "Show tool status"),
+    ("sync", "Install all tools from configuration", "Install all tools"),
+    ("generate-env", "Generate environment setup script", "Generate env script"),
+    ("container", "Manage development containers", "Manage containers"),
+    ("profile", "Manage workenv profiles", "Manage profiles"),
+    ("config", "Manage workenv configuration", "Manage configuration"),
+    ("package", "Manage provider packages", "Manage packages"),
+)
+
+# (flag, long description, short description, value completions)
+_SETUP_OPTIONS: Final = (
+    ("--init", "Initialize wrknv workenv", "Initialize workenv", None),
+    ("--shell-integration", "Set up shell aliases", "Set up shell aliases", None),
+    ("--force", "Force recreate workenv", "Force recreate", None),
+    ("--check", "Check system dependencies", "Check dependencies", None),
+    ("--completions", "Generate shell completions", "Generate completions", "bash zsh fish"),
+    ("--install", "Install completions", "Install completions", None),
+)
+
+_TF_OPTIONS: Final = (
+    ("--latest", "Install latest version", "Install latest version", None),
+    ("--list", "List available versions", "List versions", None),
+    ("--dry-run", "Show what would be installed", "Dry run", None),
+    ("--terraform", "Install Terraform instead of OpenTofu", "Use Terraform", None),
+)
+
+# Subcommand groups: parent -> ((name, long description, short description), ...)
+_GROUPS: Final = {
+    "container": (
+        ("build", "Build container image", "Build image"),
+        ("start", "Start container", "Start container"),
+        ("enter", "Enter running container", "Enter container"),
+        ("stop", "Stop container", "Stop container"),
+        ("restart", "Restart container", "Restart container"),
+        ("status", "Show container status", "Show status"),
+        ("logs", "Show container logs", "Show logs"),
+        ("clean", "Remove container and image", "Clean resources"),
+        ("rebuild", "Rebuild container from scratch", "Rebuild from scratch"),
+    ),
+    "profile": (
+        ("list", "List available profiles", "List profiles"),
+        ("save", "Save current state as profile", "Save profile"),
+        ("load", "Load profile", "Load profile"),
+        ("show", "Show profile details", "Show profile"),
+        ("delete", "Delete profile", "Delete profile"),
+        ("export", "Export profile to file", "Export profile"),
+        ("import", "Import profile from file", "Import profile"),
+    ),
+    "config": (
+        ("show", "Show configuration", "Show config"),
+        ("edit", "Edit configuration file", "Edit config"),
+        ("validate", "Validate configuration", "Validate config"),
+        ("init", "Initialize new configuration", "Initialize config"),
+        ("get", "Get configuration value", "Get value"),
+        ("set", "Set configuration value", "Set value"),
+        ("path", "Show configuration file path", "Show path"),
+    ),
+    "package": (
+        ("build", "Build provider package", "Build package"),
+        ("verify", "Verify package integrity", "Verify package"),
+        ("keygen", "Generate signing keys", "Generate keys"),
+        ("clean", "Clean package cache", "Clean cache"),
+        ("init", "Initialize new provider", "Initialize provider"),
+        ("list", "List built packages", "List packages"),
+        ("info", "Show package information", "Show package info"),
+        ("sign", "Sign package", "Sign package"),
+        ("config", "Show package configuration", "Show config"),
+    ),
+}
+
+
+def emit_bash() -> str:
+    """Emit the Bash completion script."""
+    entries = [("wrknv", " ".join(name for name, _, _ in _COMMANDS))]
+    entries.append(("setup", " ".join([*(flag for flag, *_ in _SETUP_OPTIONS), "--help"])))
+    entries.append(("tf", " ".join([*(flag for flag, *_ in _TF_OPTIONS), "--help"])))
+    entries.extend(
+        (parent, " ".join(name for name, _, _ in subs)) for parent, subs in _GROUPS.items()
+    )
+    entries.append(("--completions", "bash zsh fish"))
+    table = "\n".join(f'    [{key}]="{words}"' for key, words in entries)
+
+    return f"""# Bash completion for wrknv
+
+# Word lists keyed by the preceding word, populated once when the script
+# is sourced; each TAB press is then a single hash probe instead of a
+# case ladder re-tokenizing the same lists.
+declare -A _WRKNV_OPTS=(
+{table}
+)
+
+_wrknv_completion() {{
+    local cur prev words cword
+    _init_completion || return
+
+    local list="${{_WRKNV_OPTS[$prev]}}"
+    if [[ -n $list ]]; then
+        COMPREPLY=($(compgen -W "$list" -- "$cur"))
+        return 0
+    fi
+
+    # Everything else (including --manifest/--output/-o/--key values)
+    # falls through to file completion.
+    _filedir
+}}
+
+complete -F _wrknv_completion wrknv
+"""
+
+
+def _zsh_option_spec(flag: str, description: str, values: str | None) -> str:
+    """Format one _arguments option spec."""
+    spec = f"{flag}[{description}]"
+    if values:
+        spec += f":shell:({values})"
+    return f"        '{spec}'"
+
+
+def emit_zsh() -> str:
+    """Emit the Zsh completion script."""
+    subs_table = "\n".join(
+        "    {} $'{}'".format(
+            parent, r"\n".join(f"{name}:{long_desc}" for name, long_desc, _ in subs)
+        )
+        for parent, subs in _GROUPS.items()
+    )
+    commands = "\n".join(f"        '{name}:{long_desc}'" for name, long_desc, _ in _COMMANDS)
+    setup_options = "\n".join(_zsh_option_spec(f, d, v) for f, d, _, v in _SETUP_OPTIONS)
+    tf_options = "\n".join(_zsh_option_spec(f, d, v) for f, d, _, v in _TF_OPTIONS)
+
+    return f"""#compdef wrknv
+# Zsh completion for wrknv
+
+# When this script is eval'd directly rather than autoloaded from fpath,
+# initialize the completion system without paying compaudit on every
+# shell start: trust the cached dump (-C) unless it is older than a day.
+if ! (( ${{+functions[compdef]}} )); then
+    autoload -Uz compinit
+    if [[ -n ${{ZDOTDIR:-$HOME}}/.zcompdump(#qN.mh+24) ]]; then
+        compinit
+    else
+        compinit -C
+    fi
+fi
+
+# Subcommand tables, built once when the script is sourced. The
+# subcommand state below resolves $words[1] with a single hash probe
+# instead of walking a case ladder that redeclares these arrays on
+# every TAB.
+typeset -gA _wrknv_subs
+_wrknv_subs=(
+{subs_table}
+)
+
+_wrknv() {{
+    local -a commands
+    commands=(
+{commands}
+    )
+
+    local -a setup_options
+    setup_options=(
+{setup_options}
+    )
+
+    local -a tf_options
+    tf_options=(
+{tf_options}
+    )
+
+    _arguments -C \\
+        '1: :->command' \\
+        '2: :->subcommand' \\
+        '*:: :->args'
+
+    case $state in
+        command)
+            _describe -t commands 'wrknv command' commands
+            ;;
+        subcommand)
+            local entries=${{_wrknv_subs[$words[1]]}}
+            if [[ -n $entries ]]; then
+                local -a subcommands
+                subcommands=( ${{(f)entries}} )
+                _describe -t "${{words[1]}}_commands" "${{words[1]}} command" subcommands
+            fi
+            ;;
+        args)
+            case $words[1] in
+                setup)
+                    _arguments $setup_options
+                    ;;
+                tf)
+                    _arguments $tf_options
+                    ;;
+            esac
+            ;;
+    esac
+}}
+
+_wrknv "$@"
+"""
+
+
+def emit_fish() -> str:
+    """Emit the Fish completion script."""
+    parts = [
+        "# Fish completion for wrknv\n"
+        "\n"
+        "# Disable file completions by default\n"
+        "complete -c wrknv -f\n"
+        "\n"
+        "# Main commands\n"
+    ]
+    parts.extend(
+        f'complete -c wrknv -n "__fish_use_subcommand" -a "{name}" -d "{short_desc}"\n'
+        for name, _, short_desc in _COMMANDS
+    )
+
+    for title, options in (("Setup", _SETUP_OPTIONS), ("TF", _TF_OPTIONS)):
+        parent = title.lower()
+        parts.append(f"\n# {title} options\n")
+        for flag, _, short_desc, values in options:
+            value_arg = f' -a "{values}"' if values else ""
+            parts.append(
+                f'complete -c wrknv -n "__fish_seen_subcommand_from {parent}"'
+                f' -l {flag.removeprefix("--")}{value_arg} -d "{short_desc}"\n'
+            )
+
+    parts.append(
+        "\n"
+        "# Subcommand guard: true when the command line is exactly\n"
+        "# `wrknv <parent>`. One count/compare per keystroke, instead of the\n"
+        "# old seen/not-seen guards that scanned a ten-token list for every\n"
+        "# candidate line.\n"
+        "function __wrknv_needs_subcommand\n"
+        "    set -l words (commandline -opc)\n"
+        '    test (count $words) -eq 2; and test "$words[2]" = "$argv[1]"\n'
+        "end\n"
+    )
+    for parent, subs in _GROUPS.items():
+        parts.append(f"\n# {parent.capitalize()} subcommands\n")
+        parts.extend(
+            f'complete -c wrknv -n "__wrknv_needs_subcommand {parent}" -a "{name}" -d "{short_desc}"\n'
+            for name, _, short_desc in subs
+        )
+    return "".join(parts)
+
+
+_EMITTERS: Final = {
+    "wrknv.bash": emit_bash,
+    "wrknv.zsh": emit_zsh,
+    "wrknv.fish": emit_fish,
+}
+
+
+def main() -> None:
+    """Rewrite the shipped completion files from the spec."""
+    data_dir = Path(str(resources.files(__package__) / "completions_data"))
+    for filename, emitter in _EMITTERS.items():
+        (data_dir / filename).write_text(emitter(), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
+
+
+# 🧰🌍🔚
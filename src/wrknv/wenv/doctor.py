@@ -10,28 +10,99 @@ common problems with their wrknv setup."""
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from importlib import metadata
 import os
 from pathlib import Path
 import platform
-import shutil
+import re
 import sys
+import tomllib
 
 from provide.foundation.process import run
 from rich import box
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
+
+# Static markers _check_env_script looks for in env.sh. They are joined
+# with the per-run workenv path into one alternation so the script is
+# scanned once instead of once per substring. Kept as bytes so the scan
+# runs over the raw file contents without a UTF-8 decode.
+_ENV_SCRIPT_MARKERS = (
+    b"Generated by wrknv",
+    b"WORKENV_DIR=",
+    b"UV_INSTALLER_URL=",
+    b"uv venv",
+    b"uv sync",
+)
+
+# Markers a working env.sh must contain.
+_REQUIRED_ENV_PATTERNS = (b"WORKENV_DIR=", b"UV_INSTALLER_URL=", b"uv venv", b"uv sync")
+
+# Environment variables that commonly conflict with a wrknv workenv.
+_PROBLEMATIC_ENV_VARS = ("VIRTUAL_ENV", "PYTHONPATH", "PYTHONHOME")
+
+# Status cells for the summary table, styled once at import rather than
+# markup-parsed per row.
+_PASS_TEXT = Text("✅ PASS", style="green")
+_WARN_TEXT = Text("⚠️  WARN", style="yellow")
+_FAIL_TEXT = Text("❌ FAIL", style="red")
 
 
 class WrknvDoctor:
     """Diagnose and report on wrknv environment health."""
 
     def __init__(self) -> None:
-        self.console = Console()
         self.checks_passed = []
         self.checks_failed = []
         self.checks_warning = []
 
+    # The doctor is short-lived and several checks ask the same
+    # questions; each of these hits the getcwd/uname syscall once and
+    # serves every later check from the cache.
+
+    @cached_property
+    def console(self) -> Console:
+        """Rich console, built on first print.
+
+        Terminal detection and styling setup are skipped entirely when
+        the checks never get as far as printing."""
+        return Console()
+
+    @cached_property
+    def _cwd(self) -> Path:
+        """Working directory, resolved once per run."""
+        return Path.cwd()
+
+    @cached_property
+    def _platform_str(self) -> str:
+        """Full platform string, formatted once."""
+        return platform.platform()
+
+    @cached_property
+    def _machine(self) -> str:
+        """Raw machine architecture."""
+        return platform.machine()
+
+    @cached_property
+    def _system(self) -> str:
+        """Lowercased OS name as used in workenv paths."""
+        return platform.system().lower()
+
+    @cached_property
+    def _arch(self) -> str:
+        """Normalized architecture as used in workenv paths."""
+        machine = self._machine.lower()
+        if machine in ("x86_64", "amd64"):
+            return "amd64"
+        if machine in ("arm64", "aarch64"):
+            return "arm64"
+        return machine
+
     def run(self, verbose: bool = False) -> int:
         """
         Run all diagnostic checks.
@@ -44,15 +115,26 @@ class WrknvDoctor:
         """
         self.console.print("\n[bold cyan]🩺 Running wrknv doctor...[/bold cyan]\n")
 
-        # Run all checks
+        # System info prints as it collects, so it stays on the main
+        # thread. The remaining checks are independent and IO-bound
+        # (subprocess probes with multi-second timeouts, PATH walks,
+        # stat calls), so they run concurrently; list.append is atomic,
+        # so the workers can share the result lists directly.
         self._check_system_info()
-        self._check_wrknv_installation()
-        self._check_dependencies()
-        self._check_workenv_structure()
-        self._check_env_script()
-        self._check_config_files()
-        self._check_sibling_packages()
-        self._check_common_issues()
+
+        checks = (
+            self._check_wrknv_installation,
+            self._check_dependencies,
+            self._check_workenv_structure,
+            self._check_env_script,
+            self._check_config_files,
+            self._check_sibling_packages,
+            self._check_common_issues,
+        )
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = [executor.submit(check) for check in checks]
+            for future in futures:
+                future.result()
 
         # Print summary
         self._print_summary(verbose)
@@ -66,10 +148,10 @@ class WrknvDoctor:
         """Check and display system information."""
         try:
             info = {
-                "Platform": platform.platform(),
+                "Platform": self._platform_str,
                 "Python": f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
-                "Architecture": platform.machine(),
-                "Working Directory": str(Path.cwd()),
+                "Architecture": self._machine,
+                "Working Directory": str(self._cwd),
             }
 
             self.console.print("[bold]System Information:[/bold]")
@@ -84,25 +166,51 @@ class WrknvDoctor:
     def _check_wrknv_installation(self) -> None:
         """Check if wrknv is properly installed."""
         try:
-            # Check if wrknv module is importable
-            import wrknv
+            # Resolve the version from package metadata: one METADATA
+            # file read, no package import — so the check still answers
+            # when importing wrknv itself is what is broken.
+            try:
+                version = metadata.version("wrknv")
+            except metadata.PackageNotFoundError:
+                self.checks_failed.append(("wrknv Installation", "Module not found"))
+                return
 
-            version = getattr(wrknv, "__version__", "unknown")
             self.checks_passed.append(("wrknv Installation", f"Version {version}"))
 
-            # Check if wrknv CLI is available
-            result = run(["wrknv", "--version"], timeout=5)
-            if result.returncode == 0:
+            # Check if wrknv CLI is available. A PATH lookup answers
+            # this without forking a child interpreter that re-imports
+            # the whole package just to print its version.
+            if "wrknv" in self._path_commands:
                 self.checks_passed.append(("wrknv CLI", "Available"))
             else:
                 self.checks_warning.append(("wrknv CLI", "Not in PATH"))
-        except ImportError:
-            self.checks_failed.append(("wrknv Installation", "Module not found"))
-        except FileNotFoundError:
-            self.checks_warning.append(("wrknv CLI", "Not found in PATH"))
         except Exception as e:
             self.checks_failed.append(("wrknv Installation", str(e)))
 
+    @cached_property
+    def _path_commands(self) -> set[str]:
+        """Executable names on PATH, collected in one scan per directory.
+
+        shutil.which walks every PATH entry per lookup; one scandir pass
+        per directory answers all dependency probes from a name set.
+        """
+        available: set[str] = set()
+        for directory in os.environ.get("PATH", "").split(os.pathsep):
+            if not directory:
+                continue
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if (
+                            entry.name not in available
+                            and entry.is_file()
+                            and os.access(entry.path, os.X_OK)
+                        ):
+                            available.add(entry.name)
+            except OSError:
+                continue
+        return available
+
     def _check_dependencies(self) -> None:
         """Check for required dependencies."""
         dependencies = {
@@ -113,7 +221,7 @@ class WrknvDoctor:
         }
 
         for cmd, description in dependencies.items():
-            if shutil.which(cmd):
+            if cmd in self._path_commands:
                 self.checks_passed.append((f"{cmd}", f"{description} - Found"))
             elif cmd in ["uv"]:
                 self.checks_failed.append((f"{cmd}", f"{description} - Required but not found"))
@@ -122,46 +230,69 @@ class WrknvDoctor:
 
     def _check_workenv_structure(self) -> None:
         """Check if workenv directory exists and has correct structure."""
-        workenv_dir = Path.cwd() / "workenv"
+        workenv_dir = self._cwd / "workenv"
 
-        if not workenv_dir.exists():
+        # Stream one scandir pass: it replaces the exists() probe, and
+        # readdir stops as soon as the first subdirectory turns up
+        # instead of materializing every entry.
+        first_dir = None
+        saw_entry = False
+        try:
+            with os.scandir(workenv_dir) as entries:
+                for entry in entries:
+                    saw_entry = True
+                    if entry.is_dir(follow_symlinks=False):
+                        first_dir = entry
+                        break
+        except OSError:
             self.checks_warning.append(("workenv Directory", "Not found - run 'source env.sh' to create"))
             return
 
-        # Check for platform-specific subdirectories
-        subdirs = list(workenv_dir.iterdir())
-        if not subdirs:
+        if not saw_entry:
             self.checks_warning.append(("workenv Structure", "Empty - no environments created"))
             return
 
-        # Check structure of first workenv
-        for subdir in subdirs:
-            if subdir.is_dir():
-                expected_dirs = ["bin", "lib", "include"]
-                missing = []
-                for expected in expected_dirs:
-                    if not (subdir / expected).exists():
-                        missing.append(expected)
+        if first_dir is None:
+            return
 
-                if missing:
-                    self.checks_warning.append(
-                        (f"workenv/{subdir.name}", f"Missing directories: {', '.join(missing)}")
-                    )
-                else:
-                    self.checks_passed.append((f"workenv/{subdir.name}", "Structure OK"))
-                break
+        # Check structure of first workenv: a single listing of the
+        # subdir yields a name set, instead of three exists() stats.
+        with os.scandir(first_dir.path) as children:
+            present = {child.name for child in children}
+        missing = [expected for expected in ("bin", "lib", "include") if expected not in present]
+
+        if missing:
+            self.checks_warning.append(
+                (f"workenv/{first_dir.name}", f"Missing directories: {', '.join(missing)}")
+            )
+        else:
+            self.checks_passed.append((f"workenv/{first_dir.name}", "Structure OK"))
 
     def _check_env_script(self) -> None:
         """Check if env.sh exists and is valid."""
-        env_script = Path.cwd() / "env.sh"
+        env_script = self._cwd / "env.sh"
 
-        if not env_script.exists():
+        if "env.sh" not in self._cwd_entries:
             self.checks_failed.append(("env.sh", "Not found - run 'wrknv generate'"))
             return
 
+        content = env_script.read_bytes()
+
+        # Collect every marker in a single pass over the raw bytes; the
+        # patterns are ASCII, so decoding the whole script first buys
+        # nothing. The expected workenv path depends on cwd and platform,
+        # so the final alternation is assembled per run.
+        package_name = self._cwd.name
+        expected_workenv = f"workenv/{package_name}_{self._system}_{self._arch}"
+        marker_re = re.compile(
+            b"|".join(
+                re.escape(pattern) for pattern in (*_ENV_SCRIPT_MARKERS, expected_workenv.encode())
+            )
+        )
+        found = {match.group(0) for match in marker_re.finditer(content)}
+
         # Check if env.sh was generated by wrknv
-        content = env_script.read_text()
-        is_wrknv_generated = "Generated by wrknv" in content or "WORKENV_DIR=" in content
+        is_wrknv_generated = b"Generated by wrknv" in found or b"WORKENV_DIR=" in found
 
         if not is_wrknv_generated:
             self.checks_failed.append(
@@ -174,19 +305,7 @@ class WrknvDoctor:
             self.checks_warning.append(("env.sh", "Not executable - run 'chmod +x env.sh'"))
 
         # Check for correct workenv pattern
-        system = platform.system().lower()
-        machine = platform.machine().lower()
-        if machine in ["x86_64", "amd64"]:
-            arch = "amd64"
-        elif machine in ["arm64", "aarch64"]:
-            arch = "arm64"
-        else:
-            arch = machine
-
-        package_name = Path.cwd().name
-        expected_workenv = f"workenv/{package_name}_{system}_{arch}"
-
-        if expected_workenv not in content:
+        if expected_workenv.encode() not in found:
             self.checks_failed.append(
                 (
                     "env.sh Workenv Path",
@@ -196,17 +315,7 @@ class WrknvDoctor:
             return
 
         # Check required patterns for proper functioning
-        required_patterns = [
-            "WORKENV_DIR=",
-            "UV_INSTALLER_URL=",
-            "uv venv",
-            "uv sync",
-        ]
-
-        missing = []
-        for pattern in required_patterns:
-            if pattern not in content:
-                missing.append(pattern)
+        missing = [pattern.decode() for pattern in _REQUIRED_ENV_PATTERNS if pattern not in found]
 
         if missing:
             self.checks_failed.append(
@@ -222,8 +331,13 @@ class WrknvDoctor:
     def _test_env_script_execution(self, env_script: Path) -> None:
         """Test if env.sh can be executed successfully."""
         try:
-            # Try to source env.sh and check if VIRTUAL_ENV is set
-            result = run(["bash", "-c", f"source {env_script} && echo $VIRTUAL_ENV"], timeout=10)
+            # Try to source env.sh and check if VIRTUAL_ENV is set. The
+            # shell is started without profile or rc files so the check
+            # times the script itself, not the user's startup files.
+            result = run(
+                ["bash", "--noprofile", "--norc", "-c", f"source {env_script} && echo $VIRTUAL_ENV"],
+                timeout=10,
+            )
 
             if result.returncode != 0:
                 self.checks_failed.append(
@@ -253,21 +367,50 @@ class WrknvDoctor:
                 ("env.sh Execution", f"Unexpected error: {e}. This may be a bug in wrknv")
             )
 
+    @cached_property
+    def _cwd_entries(self) -> set[str]:
+        """Names in the working directory from one readdir.
+
+        Several checks probe fixed filenames in cwd; answering them from
+        this set costs one opendir instead of a stat per filename."""
+        try:
+            with os.scandir(self._cwd) as entries:
+                return {entry.name for entry in entries}
+        except OSError:
+            return set()
+
+    @cached_property
+    def _config_file(self) -> Path | None:
+        """Path to the wrknv config file, probed once per run."""
+        if "wrknv.toml" in self._cwd_entries:
+            return self._cwd / "wrknv.toml"
+        if ".wrknv.toml" in self._cwd_entries:  # Fallback for backwards compat
+            return self._cwd / ".wrknv.toml"
+        return None
+
+    @cached_property
+    def _wrknv_config(self) -> dict:
+        """Parsed wrknv.toml, read and parsed once per run.
+
+        Parse errors propagate: _check_config_files reports them and
+        _check_sibling_packages stays silent, as before — but a valid
+        config is now opened and parsed once instead of per check.
+        """
+        config_file = self._config_file
+        if config_file is None:
+            raise FileNotFoundError("wrknv.toml not found")
+
+        with config_file.open("rb") as f:
+            return tomllib.load(f)
+
     def _check_config_files(self) -> None:
         """Check for wrknv.toml configuration."""
-        config_file = Path.cwd() / "wrknv.toml"
-        if not config_file.exists():
-            config_file = Path.cwd() / ".wrknv.toml"  # Fallback for backwards compat
-
-        if not config_file.exists():
+        if self._config_file is None:
             self.checks_warning.append(("wrknv.toml", "Not found - using defaults"))
             return
 
         try:
-            import tomli
-
-            with config_file.open("rb") as f:
-                config = tomli.load(f)
+            config = self._wrknv_config
 
             # Check for required sections
             if "project" in config:
@@ -291,22 +434,16 @@ class WrknvDoctor:
 
     def _check_sibling_packages(self) -> None:
         """Check if configured sibling packages are accessible."""
-        config_file = Path.cwd() / "wrknv.toml"
-        if not config_file.exists():
-            config_file = Path.cwd() / ".wrknv.toml"  # Fallback for backwards compat
-        if not config_file.exists():
+        if self._config_file is None:
             return
 
         try:
-            import tomli
-
-            with config_file.open("rb") as f:
-                config = tomli.load(f)
+            config = self._wrknv_config
 
             siblings = config.get("siblings", {}).get("patterns", [])
             for sibling in siblings:
                 # Check in parent directory
-                sibling_path = Path.cwd().parent / sibling
+                sibling_path = self._cwd.parent / sibling
                 if sibling_path.exists():
                     self.checks_passed.append((f"Sibling: {sibling}", "Found"))
                 else:
@@ -317,16 +454,13 @@ class WrknvDoctor:
 
     def _check_common_issues(self) -> None:
         """Check for common issues that users encounter."""
-        # Check if .venv exists (shouldn't use this with wrknv)
-        if (Path.cwd() / ".venv").exists():
+        # Check if .venv exists (shouldn't use this with wrknv); the
+        # readdir set also catches a dangling symlink.
+        if ".venv" in self._cwd_entries:
             self.checks_warning.append((".venv Directory", "Found - should use workenv/ instead with wrknv"))
 
         # Check for conflicting environment variables
-        problematic_vars = ["VIRTUAL_ENV", "PYTHONPATH", "PYTHONHOME"]
-        active_vars = []
-        for var in problematic_vars:
-            if os.environ.get(var):
-                active_vars.append(var)
+        active_vars = [var for var in _PROBLEMATIC_ENV_VARS if os.environ.get(var)]
 
         if active_vars:
             self.checks_warning.append(
@@ -345,17 +479,15 @@ class WrknvDoctor:
         table.add_column("Status", style="bold")
         table.add_column("Details")
 
-        # Add passed checks
-        for check, details in self.checks_passed:
-            table.add_row(check, "[green]✅ PASS[/green]", details)
-
-        # Add warnings
-        for check, details in self.checks_warning:
-            table.add_row(check, "[yellow]⚠️  WARN[/yellow]", details)
-
-        # Add failed checks
-        for check, details in self.checks_failed:
-            table.add_row(check, "[red]❌ FAIL[/red]", details)
+        # One pre-styled Text per status; Rich reuses it for every row
+        # instead of re-parsing the same markup string per add_row.
+        for checks, status in (
+            (self.checks_passed, _PASS_TEXT),
+            (self.checks_warning, _WARN_TEXT),
+            (self.checks_failed, _FAIL_TEXT),
+        ):
+            for check, details in checks:
+                table.add_row(check, status, details)
 
         self.console.print(table)
 
@@ -380,7 +512,10 @@ class WrknvDoctor:
         """Print recommendations based on failed checks."""
         self.console.print("\n[bold]Recommendations:[/bold]")
 
-        recommendations = []
+        # Insertion-ordered dict keyed by command: one structure handles
+        # both priority ordering and deduplication, replacing the list
+        # plus the second seen-set pass.
+        recommendations: OrderedDict[str, str] = OrderedDict()
 
         # Priority 1: Fix critical failures
         has_env_issues = False
@@ -388,32 +523,28 @@ class WrknvDoctor:
             if "env.sh" in check or "Workenv Path" in check:
                 has_env_issues = True
             elif "uv" in check:
-                recommendations.append(("🔧 Install uv", "curl -LsSf https://astral.sh/uv/install.sh | sh"))
+                recommendations.setdefault("curl -LsSf https://astral.sh/uv/install.sh | sh", "🔧 Install uv")
             elif "wrknv Installation" in check:
-                recommendations.append(("🔧 Reinstall wrknv", "See installation docs"))
+                recommendations.setdefault("See installation docs", "🔧 Reinstall wrknv")
 
-        # If there are any env.sh issues, recommend regeneration
+        # If there are any env.sh issues, recommend regeneration first
         if has_env_issues:
-            recommendations.insert(0, ("🔄 Regenerate env.sh", "wrknv generate --force"))
-            recommendations.append(("📝 After regenerating", "source env.sh"))
+            recommendations["wrknv generate --force"] = "🔄 Regenerate env.sh"
+            recommendations.move_to_end("wrknv generate --force", last=False)
+            recommendations.setdefault("source env.sh", "📝 After regenerating")
 
         # Priority 2: Address warnings
         for check, _details in self.checks_warning:
             if ".venv Directory" in check:
-                recommendations.append(("🗑️  Remove .venv", "rm -rf .venv && source env.sh"))
+                recommendations.setdefault("rm -rf .venv && source env.sh", "🗑️  Remove .venv")
             elif "workenv Directory" in check and not has_env_issues:
-                recommendations.append(("🔧 Check workenv", "wrknv doctor"))
+                recommendations.setdefault("wrknv doctor", "🔧 Check workenv")
             elif "Virtual Environment" in check:
-                recommendations.append(("🚪 Exit current venv", "deactivate && source env.sh"))
-
-        # Remove duplicates and print
-        seen = set()
-        for title, command in recommendations:
-            key = command
-            if key not in seen:
-                self.console.print(f"\n  {title}")
-                self.console.print(f"  [dim]$ {command}[/dim]")
-                seen.add(key)
+                recommendations.setdefault("deactivate && source env.sh", "🚪 Exit current venv")
+
+        for command, title in recommendations.items():
+            self.console.print(f"\n  {title}")
+            self.console.print(f"  [dim]$ {command}[/dim]")
 
         # If multiple env.sh failures, suggest bug report
         env_failure_count = sum(1 for check, _ in self.checks_failed if "env.sh" in check)
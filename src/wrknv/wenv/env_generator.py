@@ -9,13 +9,126 @@ Generate env.sh and env.ps1 scripts from templates."""
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import os
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemLoader, ModuleLoader, Template, select_autoescape
 from provide.foundation import logger
 
-from wrknv.cli.visual import Emoji, print_success
+
+# Default template variables that do not depend on the project. Frozen at
+# module scope so generate_env_script overlays them with dict unpacking
+# instead of rebuilding ~50 dict/list literals per call; tuples keep the
+# shared defaults safe from accidental mutation.
+_STATIC_DEFAULTS = {
+    "strict_project_check": False,
+    "install_siblings": True,
+    "sibling_patterns": (),  # No default peers - specified in config
+    "special_siblings": (),  # No default peers - specified in config
+    "create_log_dir": True,
+    "deduplicate_path": True,
+    "include_tool_verification": True,  # Enable for wrknv
+    "cleanup_logs": True,
+}
+
+_TOOLS_TO_VERIFY = (
+    {
+        "name": "Python",
+        "command": "python",
+        "check_type": "command",
+        "var_name": "PYTHON",
+        "version_cmd": "python --version 2>&1",
+    },
+    {
+        "name": "UV",
+        "command": "uv",
+        "check_type": "command",
+        "var_name": "UV",
+        "version_cmd": "uv --version 2>&1",
+    },
+    {
+        "name": "wrknv",
+        "command": "wrknv",
+        "check_type": "command",
+        "var_name": "WRKENV",
+        "version_cmd": "wrknv --version 2>&1 || echo 'No version info'",
+    },
+    {
+        "name": "ibmtf",
+        "command": "ibmtf",
+        "check_type": "command",
+        "var_name": "IBMTF",
+        "version_cmd": "ibmtf version 2>&1 | head -1 || echo 'Not installed'",
+    },
+    {
+        "name": "tofu",
+        "command": "tofu",
+        "check_type": "command",
+        "var_name": "TOFU",
+        "version_cmd": "tofu version 2>&1 | head -1 || echo 'Not installed'",
+    },
+)
+
+# Tail of the useful-commands list; the first entry names the project CLI
+# and is built per call.
+_USEFUL_COMMANDS_TAIL = (
+    {"command": "wrknv status", "description": "Check tool versions"},
+    {
+        "command": "wrknv container status",
+        "description": "Container status",
+    },
+    {"command": "pytest", "description": "Run tests"},
+    {"command": "deactivate", "description": "Exit environment"},
+)
+
+
+def _make_loader(template_base_dir: Path, subdir: str) -> FileSystemLoader | ModuleLoader:
+    """Loader for one template subdirectory.
+
+    Prefers the ahead-of-time compiled modules written by
+    ``wrknv.wenv.compile_templates`` when they exist, which skips the
+    Jinja parser at runtime; falls back to the source templates.
+    """
+    compiled_dir = template_base_dir / "_compiled" / subdir
+    if compiled_dir.is_dir():
+        return ModuleLoader(compiled_dir)
+    return FileSystemLoader(template_base_dir / subdir)
+
+
+@lru_cache(maxsize=8)
+def _build_environments(
+    template_base_dir: Path,
+) -> tuple[Environment, Environment, Template, Template]:
+    """Build the sh and pwsh Jinja environments with their base templates.
+
+    Environment construction and template compilation both run the Jinja
+    parser; caching per template directory means each generator instance
+    (and the sh/ps1 pair in ``generate_both_scripts``) reuses the compiled
+    templates instead of re-parsing them.
+    """
+    sh_env = Environment(
+        loader=_make_loader(template_base_dir, "sh"),
+        autoescape=select_autoescape(),
+        trim_blocks=True,
+        lstrip_blocks=True,
+    )
+
+    ps1_env = Environment(
+        loader=_make_loader(template_base_dir, "pwsh"),
+        autoescape=select_autoescape(),
+        trim_blocks=True,
+        lstrip_blocks=True,
+    )
+
+    return (
+        sh_env,
+        ps1_env,
+        sh_env.get_template("base.sh.j2"),
+        ps1_env.get_template("base.ps1.j2"),
+    )
 
 
 class EnvScriptGenerator:
@@ -28,19 +141,10 @@ class EnvScriptGenerator:
 
         self.template_base_dir = template_base_dir
 
-        # Create separate environments for sh and pwsh templates
-        self.sh_env = Environment(
-            loader=FileSystemLoader(template_base_dir / "sh"),
-            autoescape=select_autoescape(),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
-
-        self.ps1_env = Environment(
-            loader=FileSystemLoader(template_base_dir / "pwsh"),
-            autoescape=select_autoescape(),
-            trim_blocks=True,
-            lstrip_blocks=True,
+        # Separate environments for sh and pwsh templates, shared across
+        # instances pointing at the same directory.
+        self.sh_env, self.ps1_env, self._sh_template, self._ps1_template = _build_environments(
+            template_base_dir
         )
 
     def generate_env_script(
@@ -58,90 +162,54 @@ class EnvScriptGenerator:
             script_type: Either "sh" for bash or "ps1" for PowerShell
             **kwargs: Additional template variables
         """
-        # Default configuration
+        # Compute the derived strings once; both are used more than once
+        # below and this method runs for sh and ps1 in turn.
+        name_lower = project_name.lower()
+        is_shell = script_type == "sh"
+
+        # Overlay the frozen defaults with the per-call values; kwargs
+        # last so callers can override anything.
         config = {
+            **_STATIC_DEFAULTS,
             "project_name": project_name,
             "env_profile_var": f"{project_name.upper().replace('-', '_')}_PROFILE",
-            "venv_prefix": project_name.lower(),
-            "use_spinner": script_type == "sh",  # PowerShell doesn't need spinner
-            "strict_project_check": False,
-            "install_siblings": True,
-            "sibling_patterns": [],  # No default peers - specified in config
-            "special_siblings": [],  # No default peers - specified in config
-            "create_log_dir": True,
-            "deduplicate_path": True,
-            "include_tool_verification": True,  # Enable for wrknv
-            "cleanup_logs": True,
-            "tools_to_verify": [
-                {
-                    "name": "Python",
-                    "command": "python",
-                    "check_type": "command",
-                    "var_name": "PYTHON",
-                    "version_cmd": "python --version 2>&1",
-                },
-                {
-                    "name": "UV",
-                    "command": "uv",
-                    "check_type": "command",
-                    "var_name": "UV",
-                    "version_cmd": "uv --version 2>&1",
-                },
-                {
-                    "name": "wrknv",
-                    "command": "wrknv",
-                    "check_type": "command",
-                    "var_name": "WRKENV",
-                    "version_cmd": "wrknv --version 2>&1 || echo 'No version info'",
-                },
-                {
-                    "name": "ibmtf",
-                    "command": "ibmtf",
-                    "check_type": "command",
-                    "var_name": "IBMTF",
-                    "version_cmd": "ibmtf version 2>&1 | head -1 || echo 'Not installed'",
-                },
-                {
-                    "name": "tofu",
-                    "command": "tofu",
-                    "check_type": "command",
-                    "var_name": "TOFU",
-                    "version_cmd": "tofu version 2>&1 | head -1 || echo 'Not installed'",
-                },
-            ],
+            "venv_prefix": name_lower,
+            "use_spinner": is_shell,  # PowerShell doesn't need spinner
+            "tools_to_verify": _TOOLS_TO_VERIFY,
             "useful_commands": [
                 {
-                    "command": f"{project_name.lower()} --help",
+                    "command": f"{name_lower} --help",
                     "description": f"{project_name} CLI",
                 },
-                {"command": "wrknv status", "description": "Check tool versions"},
-                {
-                    "command": "wrknv container status",
-                    "description": "Container status",
-                },
-                {"command": "pytest", "description": "Run tests"},
-                {"command": "deactivate", "description": "Exit environment"},
+                *_USEFUL_COMMANDS_TAIL,
             ],
+            **kwargs,
         }
 
-        # Update with user-provided kwargs
-        config.update(kwargs)
-
-        # Select appropriate template and environment
-        if script_type == "sh":
-            template = self.sh_env.get_template("base.sh.j2")
+        # Select appropriate pre-compiled template
+        if is_shell:
+            template = self._sh_template
         elif script_type == "ps1":
-            template = self.ps1_env.get_template("base.ps1.j2")
+            template = self._ps1_template
         else:
             raise ValueError(f"Unknown script type: {script_type}")
 
         # Render and write
         content = template.render(**config)
-        output_path.write_text(content)
-
-        # Make executable if it's a shell script
-        if script_type == "sh":
-            output_path.chmod(output_path.stat().st_mode | 0o111)
+        if is_shell:
+            # Open with the executable bits in the creation mode instead
+            # of write_text followed by a path stat plus chmod; the fstat
+            # on the open fd covers a pre-existing or umask-stripped file.
+            fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+            try:
+                mode = os.fstat(fd).st_mode
+                if mode & 0o111 != 0o111:
+                    os.fchmod(fd, mode | 0o111)
+                os.write(fd, content.encode("utf-8"))
+            finally:
+                os.close(fd)
+        else:
+            output_path.write_text(content)
 
     def generate_both_scripts(
         self,
@@ -157,8 +225,14 @@ class EnvScriptGenerator:
         sh_path = project_dir / "env.sh"
         ps1_path = project_dir / "env.ps1"
 
-        self.generate_env_script(project_name, sh_path, "sh", **kwargs)
-        self.generate_env_script(project_name, ps1_path, "ps1", **kwargs)
+        # The two scripts are independent; rendering one overlaps with
+        # writing the other. Compiled Jinja templates are safe to render
+        # from multiple threads.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            sh_future = executor.submit(self.generate_env_script, project_name, sh_path, "sh", **kwargs)
+            ps1_future = executor.submit(self.generate_env_script, project_name, ps1_path, "ps1", **kwargs)
+            sh_future.result()
+            ps1_future.result()
 
         return sh_path, ps1_path
 
@@ -231,6 +305,10 @@ def create_project_env_scripts(project_dir: Path, workenv_name: str | None = Non
     generator = EnvScriptGenerator()
     sh_path, ps1_path = generator.generate_both_scripts(project_name, project_dir, **extra_config)
 
+    # Imported here so importing this module does not pull in the CLI
+    # presentation layer.
+    from wrknv.cli.visual import Emoji, print_success
+
     print_success(f"Generated {sh_path}", Emoji.SUCCESS)
     print_success(f"Generated {ps1_path}", Emoji.SUCCESS)
 
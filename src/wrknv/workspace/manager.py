@@ -9,16 +9,66 @@ Manage multi-repo workspaces with configuration synchronization."""
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import os
 from pathlib import Path
 from typing import Any
 
 from provide.foundation import logger
-from provide.foundation.file import read_toml, write_toml
+from provide.foundation.file import read_toml
+import tomli_w
+
+from wrknv.wenv.env_generator import create_project_env_scripts
 
 from .discovery import WorkspaceDiscovery
 from .schema import RepoConfig, TemplateSource, WorkspaceConfig
 from .sync import WorkspaceSync
 
+# Default-selection tables for new repos; built once at import instead
+# of per call (the feature helper runs once per discovered repo).
+_DEFAULT_PROFILES: dict[str, str] = {
+    "foundation": "foundation-based",
+    "foundation-based": "foundation-based",
+    "provider": "pyvider-plugin",
+    "pyvider-plugin": "pyvider-plugin",
+    "testkit": "testkit-extension",
+    "packaging": "standalone",
+}
+
+_BASE_FEATURES: tuple[str, ...] = ("pyproject", "claude", "gitignore")
+
+_TYPE_FEATURES: dict[str, tuple[str, ...]] = {
+    "foundation-based": (*_BASE_FEATURES, "coverage"),
+    "pyvider-plugin": (*_BASE_FEATURES, "coverage"),
+    "testkit": (*_BASE_FEATURES, "coverage"),
+}
+
+_DEFAULT_STANDARDS: dict[str, Any] = {
+    "python_version": "3.11",
+    "ruff_line_length": 111,
+    "authors": [{"name": "Tim Perkins", "email": "code@tim.life"}],
+    "maintainers": [{"name": "provide.io", "email": "code@provide.io"}],
+    "license": "Apache-2.0",
+    "development_status": "3 - Alpha",
+}
+
+
+def _write_toml_atomic(path: Path, data: dict[str, Any]) -> None:
+    """Stream data as TOML to a same-directory temp file, then rename.
+
+    tomli_w.dump encodes straight to the file object, so the document is
+    never materialized as one in-memory string; os.replace keeps the
+    swap atomic."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as fh:
+            tomli_w.dump(data, fh)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
 
 class WorkspaceManager:
     """Manage multi-repo workspaces."""
@@ -28,6 +78,10 @@ class WorkspaceManager:
         self.config_dir = self.root / ".wrknv"
         self.config_path = self.config_dir / "workspace.toml"
         self.discovery = WorkspaceDiscovery(self.root)
+        # Parsed config keyed by (st_mtime_ns, st_size) of workspace.toml,
+        # so methods that each call load_config share one parse per file
+        # state instead of re-reading the TOML every time.
+        self._config_cache: tuple[tuple[int, int], WorkspaceConfig] | None = None
 
     def init_workspace(
         self, template_source: str | None = None, auto_discover: bool = True
@@ -77,30 +131,48 @@ class WorkspaceManager:
 
     def load_config(self) -> WorkspaceConfig | None:
         """Load workspace configuration."""
-        if not self.config_path.exists():
+        try:
+            stat = self.config_path.stat()
+        except OSError:
             return None
 
+        cache_key = (stat.st_mtime_ns, stat.st_size)
+        if self._config_cache is not None and self._config_cache[0] == cache_key:
+            return self._config_cache[1]
+
         try:
             data = read_toml(self.config_path, default={})
             if not data:
                 return None
-            return WorkspaceConfig.from_dict(data)
+            config = WorkspaceConfig.from_dict(data)
 
         except Exception as e:
             logger.error("❌ Failed to load workspace config", error=str(e))
             return None
 
+        self._config_cache = (cache_key, config)
+        return config
+
     def save_config(self, config: WorkspaceConfig) -> None:
         """Save workspace configuration."""
         try:
-            # Convert to dictionary and write with foundation's atomic TOML writer
-            write_toml(self.config_path, config.to_dict(), atomic=True)
+            # Convert to dictionary and stream to disk atomically
+            _write_toml_atomic(self.config_path, config.to_dict())
             logger.debug("💾 Workspace config saved", path=str(self.config_path))
 
         except Exception as e:
+            self._config_cache = None
             logger.error("❌ Failed to save workspace config", error=str(e))
             raise
 
+        # Seed the cache with what was just written so the next
+        # load_config is a hit without re-parsing.
+        try:
+            stat = self.config_path.stat()
+            self._config_cache = ((stat.st_mtime_ns, stat.st_size), config)
+        except OSError:
+            self._config_cache = None
+
     def add_repo(
         self,
         repo_path: Path | str,
@@ -199,38 +271,16 @@ class WorkspaceManager:
 
     def _get_default_profile(self, repo_type: str | None) -> str:
         """Get default template profile for repository type."""
-        profiles = {
-            "foundation": "foundation-based",
-            "foundation-based": "foundation-based",
-            "provider": "pyvider-plugin",
-            "pyvider-plugin": "pyvider-plugin",
-            "testkit": "testkit-extension",
-            "packaging": "standalone",
-        }
-        return profiles.get(repo_type or "unknown", "standalone")
+        return _DEFAULT_PROFILES.get(repo_type or "unknown", "standalone")
 
     def _get_default_features(self, repo_type: str | None) -> list[str]:
         """Get default features for repository type."""
-        base_features = ["pyproject", "claude", "gitignore"]
-
-        type_features = {
-            "foundation-based": [*base_features, "coverage"],
-            "pyvider-plugin": [*base_features, "coverage"],
-            "testkit": [*base_features, "coverage"],
-        }
-
-        return type_features.get(repo_type or "unknown", base_features)
+        # Copied into a list per call since RepoConfig.features is list[str]
+        return list(_TYPE_FEATURES.get(repo_type or "unknown", _BASE_FEATURES))
 
     def _get_default_standards(self) -> dict[str, Any]:
         """Get default global standards."""
-        return {
-            "python_version": "3.11",
-            "ruff_line_length": 111,
-            "authors": [{"name": "Tim Perkins", "email": "code@tim.life"}],
-            "maintainers": [{"name": "provide.io", "email": "code@provide.io"}],
-            "license": "Apache-2.0",
-            "development_status": "3 - Alpha",
-        }
+        return dict(_DEFAULT_STANDARDS)
 
     def setup_workspace(self, generate_only: bool = False) -> dict[str, Any]:
         """Setup all repositories in workspace.
@@ -241,8 +291,6 @@ class WorkspaceManager:
         Returns:
             Dictionary with setup results
         """
-        from wrknv.wenv.env_generator import create_project_env_scripts
-
         config = self.load_config()
         if config is None:
             raise RuntimeError("No workspace configuration found. Run 'wrknv workspace init' first.")
@@ -254,31 +302,44 @@ class WorkspaceManager:
             "generated": [],
         }
 
-        for repo in config.repos:
-            repo_path = repo.path if repo.path.is_absolute() else self.root / repo.path
+        if not config.repos:
+            return results
 
-            if not repo_path.exists():
-                results["failures"][repo.name] = f"Repository path does not exist: {repo_path}"
-                continue
+        def setup_one(repo: RepoConfig) -> tuple[str, dict[str, str] | None, str | None]:
+            """Generate env scripts for one repo; returns (name, generated, error)."""
+            repo_path = repo.path if repo.path.is_absolute() else self.root / repo.path
 
-            if not (repo_path / "pyproject.toml").exists():
-                results["failures"][repo.name] = "No pyproject.toml found"
-                continue
+            # One stat on pyproject.toml answers both "repo exists" and
+            # "pyproject present"; only the failure path pays a second
+            # syscall to tell the two apart.
+            try:
+                os.stat(repo_path / "pyproject.toml")
+            except OSError:
+                if not os.path.exists(repo_path):
+                    return (repo.name, None, f"Repository path does not exist: {repo_path}")
+                return (repo.name, None, "No pyproject.toml found")
 
             try:
-                # Generate env scripts
                 logger.info(f"📝 Generating env scripts for {repo.name}")
                 sh_path, ps1_path = create_project_env_scripts(repo_path)
-
-                results["generated"].append(
-                    {"repo": repo.name, "sh_path": str(sh_path), "ps1_path": str(ps1_path)}
-                )
-
-                results["success_count"] += 1
-
             except Exception as e:
                 logger.error(f"❌ Failed to setup {repo.name}", error=str(e))
-                results["failures"][repo.name] = str(e)
+                return (repo.name, None, str(e))
+
+            return (repo.name, {"repo": repo.name, "sh_path": str(sh_path), "ps1_path": str(ps1_path)}, None)
+
+        # The per-repo work is filesystem stats and writes, so a thread
+        # pool overlaps disk latency across repos; results are
+        # aggregated on this thread as repos finish.
+        with ThreadPoolExecutor(max_workers=min(32, len(config.repos))) as executor:
+            futures = [executor.submit(setup_one, repo) for repo in config.repos]
+            for future in as_completed(futures):
+                name, generated, error = future.result()
+                if error is not None:
+                    results["failures"][name] = error
+                else:
+                    results["generated"].append(generated)
+                    results["success_count"] += 1
 
         return results
 
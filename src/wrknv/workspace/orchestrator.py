@@ -10,19 +10,43 @@ Execute tasks across multiple repositories in workspace."""
 from __future__ import annotations
 
 import asyncio
-from fnmatch import fnmatch
+from fnmatch import translate
+from functools import lru_cache
+import os
 from pathlib import Path
+import re
+import time
 
 from attrs import define, field
 from provide.foundation import logger
 
 from wrknv.tasks.executor import TaskExecutor
 from wrknv.tasks.registry import TaskRegistry
-from wrknv.tasks.schema import TaskResult
+from wrknv.tasks.schema import TaskConfig, TaskResult
 
 from .discovery import RepoInfo, WorkspaceDiscovery
 
 
+@lru_cache(maxsize=256)
+def _cached_registry(repo_path: str, mtime_ns: int) -> TaskRegistry:
+    """Parsed task registry for a repo, keyed by its wrknv.toml mtime.
+
+    Back-to-back orchestrations hit the same repos; the mtime in the key
+    invalidates the entry naturally when the file changes."""
+    return TaskRegistry.from_repo(Path(repo_path))
+
+
+def _load_registry(repo_path: Path) -> TaskRegistry:
+    """Load a repo's task registry through the mtime-keyed cache."""
+    try:
+        mtime_ns = os.stat(repo_path / "wrknv.toml").st_mtime_ns
+    except OSError:
+        # No config file to key a cache on; from_repo returns an empty
+        # registry for this case anyway.
+        return TaskRegistry.from_repo(repo_path)
+    return _cached_registry(str(repo_path), mtime_ns)
+
+
 @define
 class WorkspaceTaskResult:
     """Result of running a task across workspace repos."""
@@ -55,6 +79,11 @@ class WorkspaceOrchestrator:
 
     root: Path = field(converter=Path)
     discovery: WorkspaceDiscovery = field(init=False)
+    # Discovery results per (patterns, filter) query, so running several
+    # tasks on one orchestrator walks the workspace tree only once.
+    _discovery_cache: dict[tuple[tuple[str, ...], str | None], list[RepoInfo]] = field(
+        init=False, factory=dict
+    )
 
     def __attrs_post_init__(self) -> None:
         """Initialize discovery after attrs creates instance."""
@@ -67,6 +96,10 @@ class WorkspaceOrchestrator:
     ) -> list[RepoInfo]:
         """Discover repositories with optional pattern filtering.
 
+        Repeated calls with the same patterns and filter return the
+        cached result; call invalidate_discovery_cache() after repos
+        are added or removed on disk.
+
         Args:
             patterns: Discovery patterns (default: ["*"] to find all)
             repo_filter: Additional glob pattern to filter discovered repos
@@ -78,16 +111,28 @@ class WorkspaceOrchestrator:
         if patterns is None:
             patterns = ["*"]
 
+        cache_key = (tuple(patterns), repo_filter)
+        cached = self._discovery_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Discover all repos matching initial patterns
         repos = self.discovery.discover_repos(patterns=patterns)
 
-        # Apply additional filter if provided
+        # Apply additional filter if provided, compiling the glob once
+        # instead of per repo
         if repo_filter:
-            repos = [repo for repo in repos if fnmatch(repo.name or "", repo_filter)]
+            filter_re = re.compile(translate(repo_filter))
+            repos = [repo for repo in repos if filter_re.match(repo.name or "")]
             logger.info("Filtered repositories", filter=repo_filter, count=len(repos))
 
+        self._discovery_cache[cache_key] = repos
         return repos
 
+    def invalidate_discovery_cache(self) -> None:
+        """Drop cached discovery results so the next query re-walks."""
+        self._discovery_cache.clear()
+
     async def run_task_sequential(
         self,
         task_name: str,
@@ -106,8 +151,6 @@ class WorkspaceOrchestrator:
         Returns:
             WorkspaceTaskResult with aggregated results
         """
-        import time
-
         start_time = time.time()
         results: dict[str, TaskResult] = {}
         succeeded = 0
@@ -131,7 +174,7 @@ class WorkspaceOrchestrator:
 
             try:
                 # Load task registry for this repo
-                registry = TaskRegistry.from_repo(repo.path)
+                registry = _load_registry(repo.path)
 
                 # Resolve task (handles _default resolution)
                 try:
@@ -188,8 +231,6 @@ class WorkspaceOrchestrator:
                 )
 
                 # Create minimal task config for error result
-                from wrknv.tasks.schema import TaskConfig
-
                 error_task = TaskConfig(name=task_name, run=f"# Error: {e}")
                 results[repo_name] = TaskResult(
                     task=error_task,
@@ -216,11 +257,160 @@ class WorkspaceOrchestrator:
             duration=duration,
         )
 
+    async def run_task_bounded(
+        self,
+        task_name: str,
+        repos: list[RepoInfo],
+        concurrency: int | None = None,
+        fail_fast: bool = False,
+        env: dict[str, str] | None = None,
+    ) -> WorkspaceTaskResult:
+        """Run task across repos with bounded concurrency.
+
+        Overlaps the subprocess wait time of up to ``concurrency`` repos
+        while keeping output readable: each repo's header and outcome are
+        logged as one block when it completes, in completion order.
+
+        Args:
+            task_name: Name of task to run
+            repos: List of repositories to execute in
+            concurrency: Maximum repos in flight (default: cpu count)
+            fail_fast: Cancel outstanding repos after the first failure
+            env: Additional environment variables
+
+        Returns:
+            WorkspaceTaskResult with aggregated results
+        """
+        start_time = time.time()
+
+        if concurrency is None:
+            concurrency = os.cpu_count() or 4
+        semaphore = asyncio.Semaphore(concurrency)
+
+        logger.info(
+            "Running task across workspace with bounded concurrency",
+            task=task_name,
+            repos=len(repos),
+            concurrency=concurrency,
+            fail_fast=fail_fast,
+        )
+
+        async def run_in_repo(repo: RepoInfo) -> tuple[str, TaskResult | None]:
+            """Run task in a single repo, gated by the semaphore."""
+            repo_name = repo.name or repo.path.name
+
+            async with semaphore:
+                try:
+                    # Load task registry
+                    registry = _load_registry(repo.path)
+
+                    # Resolve task (handles _default resolution)
+                    try:
+                        task, task_args = registry.resolve_task(task_name)
+                    except ValueError:
+                        return (repo_name, None)
+
+                    # Create executor
+                    executor = TaskExecutor(
+                        repo_path=repo.path,
+                        env=env,
+                        package_name=repo.name,
+                        auto_detect_env=True,
+                    )
+
+                    # Execute
+                    result = await executor.execute(task, args=task_args, dry_run=False)
+                    return (repo_name, result)
+
+                except Exception as e:
+                    logger.error(
+                        f"Exception running task in {repo_name}",
+                        repo=repo_name,
+                        error=str(e),
+                        error_type=type(e).__name__,
+                    )
+
+                    # Return error result
+                    error_task = TaskConfig(name=task_name, run=f"# Error: {e}")
+                    error_result = TaskResult(
+                        task=error_task,
+                        success=False,
+                        exit_code=-1,
+                        stdout="",
+                        stderr=str(e),
+                        duration=0.0,
+                    )
+                    return (repo_name, error_result)
+
+        tasks = [asyncio.ensure_future(run_in_repo(repo)) for repo in repos]
+
+        results: dict[str, TaskResult] = {}
+        succeeded = 0
+        failed = 0
+        skipped = 0
+
+        try:
+            for future in asyncio.as_completed(tasks):
+                repo_name, result = await future
+
+                # Emit each repo's block contiguously on completion
+                logger.info("=" * 80)
+                logger.info(f"▶ Ran '{task_name}' in {repo_name}", repo=repo_name, task=task_name)
+
+                if result is None:
+                    logger.warning(
+                        f"Task '{task_name}' not found in {repo_name}",
+                        repo=repo_name,
+                        task=task_name,
+                    )
+                    skipped += 1
+                    continue
+
+                results[repo_name] = result
+                if result.success:
+                    succeeded += 1
+                    logger.info(
+                        f"✓ Task '{task_name}' succeeded in {repo_name}",
+                        repo=repo_name,
+                        duration=result.duration,
+                    )
+                else:
+                    failed += 1
+                    logger.error(
+                        f"✗ Task '{task_name}' failed in {repo_name}",
+                        repo=repo_name,
+                        exit_code=result.exit_code,
+                        duration=result.duration,
+                    )
+
+                    if fail_fast:
+                        logger.error("Stopping due to --fail-fast", failed_repo=repo_name)
+                        break
+        finally:
+            # Cancel anything still outstanding (fail-fast or error)
+            for task_future in tasks:
+                if not task_future.done():
+                    task_future.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        duration = time.time() - start_time
+
+        return WorkspaceTaskResult(
+            task_name=task_name,
+            repo_results=results,
+            total_repos=len(repos),
+            succeeded=succeeded,
+            failed=failed,
+            skipped=skipped,
+            duration=duration,
+        )
+
     async def run_task_parallel(
         self,
         task_name: str,
         repos: list[RepoInfo],
         env: dict[str, str] | None = None,
+        max_concurrency: int | None = None,
     ) -> WorkspaceTaskResult:
         """Run task in parallel across repos.
 
@@ -228,6 +418,8 @@ class WorkspaceOrchestrator:
             task_name: Name of task to run
             repos: List of repositories to execute in
             env: Additional environment variables
+            max_concurrency: Maximum repos in flight (default: twice the
+                cpu count, so wide workspaces don't fork everything at once)
 
         Returns:
             WorkspaceTaskResult with aggregated results
@@ -236,14 +428,17 @@ class WorkspaceOrchestrator:
             Parallel mode runs all repos concurrently. Output from different
             repos may be interleaved. Use sequential mode for clearer output.
         """
-        import time
-
         start_time = time.time()
 
+        if max_concurrency is None:
+            max_concurrency = (os.cpu_count() or 4) * 2
+        semaphore = asyncio.Semaphore(max_concurrency)
+
         logger.info(
             "Running task in parallel across workspace",
             task=task_name,
             repos=len(repos),
+            max_concurrency=max_concurrency,
         )
 
         async def run_in_repo(repo: RepoInfo) -> tuple[str, TaskResult | None]:
@@ -252,7 +447,7 @@ class WorkspaceOrchestrator:
 
             try:
                 # Load task registry
-                registry = TaskRegistry.from_repo(repo.path)
+                registry = _load_registry(repo.path)
 
                 # Resolve task (handles _default resolution)
                 try:
@@ -286,8 +481,6 @@ class WorkspaceOrchestrator:
                 )
 
                 # Return error result
-                from wrknv.tasks.schema import TaskConfig
-
                 error_task = TaskConfig(name=task_name, run=f"# Error: {e}")
                 error_result = TaskResult(
                     task=error_task,
@@ -299,8 +492,18 @@ class WorkspaceOrchestrator:
                 )
                 return (repo_name, error_result)
 
-        # Run all repos in parallel
-        repo_results_list = await asyncio.gather(*[run_in_repo(repo) for repo in repos])
+        # Run all repos, at most max_concurrency at a time; the TaskGroup
+        # gives structured cancellation and outcomes are collected as
+        # repos finish instead of in one gathered list
+        outcomes: list[tuple[str, TaskResult | None]] = []
+
+        async def run_bounded(repo: RepoInfo) -> None:
+            async with semaphore:
+                outcomes.append(await run_in_repo(repo))
+
+        async with asyncio.TaskGroup() as task_group:
+            for repo in repos:
+                task_group.create_task(run_bounded(repo))
 
         # Aggregate results
         results: dict[str, TaskResult] = {}
@@ -308,7 +511,7 @@ class WorkspaceOrchestrator:
         failed = 0
         skipped = 0
 
-        for repo_name, result in repo_results_list:
+        for repo_name, result in outcomes:
             if result is None:
                 skipped += 1
             else:
@@ -337,6 +540,7 @@ class WorkspaceOrchestrator:
         repo_filter: str | None = None,
         parallel: bool = False,
         fail_fast: bool = False,
+        concurrency: int | None = None,
         env: dict[str, str] | None = None,
     ) -> WorkspaceTaskResult:
         """Run task across workspace repositories.
@@ -346,7 +550,10 @@ class WorkspaceOrchestrator:
             repo_patterns: Discovery patterns for finding repos (default: ["*"])
             repo_filter: Additional glob filter to apply to repo names
             parallel: Run in parallel if True, sequential if False
-            fail_fast: Stop on first failure (sequential mode only)
+            fail_fast: Stop on first failure (sequential and bounded modes)
+            concurrency: Run with at most this many repos in flight,
+                logging each repo's block on completion (overrides
+                parallel/sequential routing)
             env: Additional environment variables to pass to tasks
 
         Returns:
@@ -380,7 +587,11 @@ class WorkspaceOrchestrator:
                 duration=0.0,
             )
 
-        # Execute in parallel or sequential mode
+        # Execute in bounded, parallel, or sequential mode
+        if concurrency is not None:
+            return await self.run_task_bounded(
+                task_name, repos, concurrency=concurrency, fail_fast=fail_fast, env=env
+            )
         if parallel:
             return await self.run_task_parallel(task_name, repos, env=env)
         else:
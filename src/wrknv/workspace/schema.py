@@ -45,6 +45,8 @@ class RepoConfig:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary, excluding None values for TOML compatibility."""
+        # Optional fields are inserted conditionally - TOML cannot
+        # serialize None, and this skips a second filter pass.
         data = {
             "path": str(self.path),
             "name": self.name,
@@ -52,11 +54,12 @@ class RepoConfig:
             "template_profile": self.template_profile,
             "features": self.features,
             "custom_values": self.custom_values,
-            "last_sync": self.last_sync,
-            "template_version": self.template_version,
         }
-        # Filter out None values - TOML cannot serialize None
-        return {k: v for k, v in data.items() if v is not None}
+        if self.last_sync is not None:
+            data["last_sync"] = self.last_sync
+        if self.template_version is not None:
+            data["template_version"] = self.template_version
+        return data
 
 
 @define(frozen=True)
@@ -80,14 +83,15 @@ class TemplateSource:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary, excluding None values for TOML compatibility."""
-        data = {
+        data: dict[str, Any] = {
             "type": self.type,
             "location": self.location,
-            "version": self.version,
-            "branch": self.branch,
         }
-        # Filter out None values - TOML cannot serialize None
-        return {k: v for k, v in data.items() if v is not None}
+        if self.version is not None:
+            data["version"] = self.version
+        if self.branch is not None:
+            data["branch"] = self.branch
+        return data
 
 
 @define(frozen=True)
@@ -100,6 +104,9 @@ class WorkspaceConfig(BaseConfig):
     template_source: TemplateSource | None = None
     global_standards: dict[str, Any] = field(factory=dict)
     sync_strategy: str = "manual"  # "manual", "auto", "check"
+    # Lazy name -> repo index; built once per (immutable) instance so
+    # lookups are hash probes instead of list scans.
+    _by_name: dict[str, RepoConfig] | None = field(init=False, default=None, eq=False, repr=False)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any], source: Any = None) -> WorkspaceConfig:
@@ -121,29 +128,34 @@ class WorkspaceConfig(BaseConfig):
 
     def to_dict(self, include_sensitive: bool = True) -> dict[str, Any]:
         """Convert to dictionary, excluding None values for TOML compatibility."""
-        data = {
+        data: dict[str, Any] = {
             "version": self.version,
             "root": str(self.root),
             "repos": [repo.to_dict() for repo in self.repos],
-            "template_source": self.template_source.to_dict() if self.template_source else None,
-            "global_standards": self.global_standards,
-            "sync_strategy": self.sync_strategy,
         }
-        # Filter out None values - TOML cannot serialize None
-        return {k: v for k, v in data.items() if v is not None}
+        if self.template_source is not None:
+            data["template_source"] = self.template_source.to_dict()
+        data["global_standards"] = self.global_standards
+        data["sync_strategy"] = self.sync_strategy
+        return data
+
+    def _index(self) -> dict[str, RepoConfig]:
+        """Name -> repo map, populated on first use."""
+        if self._by_name is None:
+            object.__setattr__(self, "_by_name", {repo.name: repo for repo in self.repos})
+        return self._by_name  # type: ignore[return-value]
 
     def find_repo(self, name: str) -> RepoConfig | None:
         """Find repository by name."""
-        for repo in self.repos:
-            if repo.name == name:
-                return repo
-        return None
+        return self._index().get(name)
 
     def add_repo(self, repo: RepoConfig) -> WorkspaceConfig:
         """Add repository to workspace."""
-        # Remove existing repo with same name
-        repos = [r for r in self.repos if r.name != repo.name]
-        repos.append(repo)
+        # Replace existing repo with same name, keeping it last
+        by_name = dict(self._index())
+        by_name.pop(repo.name, None)
+        by_name[repo.name] = repo
+        repos = list(by_name.values())
 
         return self.__class__(
             version=self.version,
@@ -156,7 +168,9 @@ class WorkspaceConfig(BaseConfig):
 
     def remove_repo(self, name: str) -> WorkspaceConfig:
         """Remove repository from workspace."""
-        repos = [r for r in self.repos if r.name != name]
+        by_name = dict(self._index())
+        by_name.pop(name, None)
+        repos = list(by_name.values())
 
         return self.__class__(
             version=self.version,
@@ -338,6 +338,37 @@ class TestEnvGeneratorCoverage:
         with pytest.raises(ValueError, match="Unknown script type"):
             gen.generate_env_script("myproject", tmp_path / "out.txt", script_type="bat")
 
+    def test_compiled_templates_are_used_when_present(self, tmp_path) -> None:
+        """A _compiled dir switches the generator to ModuleLoader output."""
+        from pathlib import Path
+        import shutil
+
+        from jinja2 import ModuleLoader
+
+        from wrknv.wenv.compile_templates import compile_env_templates
+
+        actual_tmpl = Path(__file__).parent.parent.parent / "src" / "wrknv" / "templates" / "env"
+        shutil.copytree(actual_tmpl / "sh", tmp_path / "sh")
+        shutil.copytree(actual_tmpl / "pwsh", tmp_path / "pwsh")
+
+        source_gen = EnvScriptGenerator(template_base_dir=tmp_path)
+        source_out = tmp_path / "source-env.sh"
+        source_gen.generate_env_script("myproject", source_out)
+
+        compile_env_templates(tmp_path)
+        # New cache key so _build_environments re-probes the loader
+        compiled_base = tmp_path / "moved"
+        compiled_base.mkdir()
+        for entry in ("sh", "pwsh", "_compiled"):
+            shutil.move(str(tmp_path / entry), str(compiled_base / entry))
+
+        compiled_gen = EnvScriptGenerator(template_base_dir=compiled_base)
+        assert isinstance(compiled_gen.sh_env.loader, ModuleLoader)
+
+        compiled_out = tmp_path / "compiled-env.sh"
+        compiled_gen.generate_env_script("myproject", compiled_out)
+        assert compiled_out.read_text() == source_out.read_text()
+
     def test_create_project_env_scripts_missing_pyproject(self, tmp_path) -> None:
         """Line 179: missing pyproject.toml raises FileNotFoundError."""
         with pytest.raises(FileNotFoundError, match=r"pyproject\.toml"):
@@ -65,7 +65,7 @@ class TestContainerExecNonInteractive:
         with patch("wrknv.container.runtime.docker.run") as mock_run:
             mock_run.side_effect = [
                 # container_running check
-                CompletedProcess(args=[], returncode=0, stdout="test-container", stderr=""),
+                CompletedProcess(args=[], returncode=0, stdout="test-container\trunning", stderr=""),
                 # exec_in_container
                 CompletedProcess(args=[], returncode=0, stdout="hello output", stderr=""),
             ]
@@ -78,7 +78,7 @@ class TestContainerExecNonInteractive:
         ex = make_exec()
         with patch("wrknv.container.runtime.docker.run") as mock_run:
             mock_run.side_effect = [
-                CompletedProcess(args=[], returncode=0, stdout="test-container", stderr=""),
+                CompletedProcess(args=[], returncode=0, stdout="test-container\trunning", stderr=""),
                 CompletedProcess(args=[], returncode=0, stdout="", stderr=""),
             ]
             result = ex.exec(command=["true"], interactive=False, tty=False)
@@ -92,7 +92,7 @@ class TestContainerExecNonInteractive:
         with patch("wrknv.container.runtime.docker.run") as mock_run:
             mock_run.side_effect = [
                 # container_running
-                CompletedProcess(args=[], returncode=0, stdout="test-container", stderr=""),
+                CompletedProcess(args=[], returncode=0, stdout="test-container\trunning", stderr=""),
                 # exec fails
                 err,
             ]
@@ -105,7 +105,7 @@ class TestContainerExecNonInteractive:
         ex = make_exec()
         with patch("wrknv.container.runtime.docker.run") as mock_run:
             mock_run.side_effect = [
-                CompletedProcess(args=[], returncode=0, stdout="test-container", stderr=""),
+                CompletedProcess(args=[], returncode=0, stdout="test-container\trunning", stderr=""),
                 CompletedProcess(args=[], returncode=0, stdout="", stderr=""),
             ]
             result = ex.exec(command=None, shell="/bin/bash", interactive=False, tty=False)
@@ -118,7 +118,7 @@ class TestContainerExecNonInteractive:
         with patch("wrknv.container.runtime.docker.run") as mock_run:
             mock_run.side_effect = [
                 # container_running
-                CompletedProcess(args=[], returncode=0, stdout="test-container", stderr=""),
+                CompletedProcess(args=[], returncode=0, stdout="test-container\trunning", stderr=""),
                 # _detect_shell: test -f /bin/bash succeeds
                 CompletedProcess(args=[], returncode=0, stdout="", stderr=""),
                 # exec_in_container call with ['/bin/bash']
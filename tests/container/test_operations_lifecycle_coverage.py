@@ -53,7 +53,9 @@ class TestContainerLifecycleBasicChecks:
         """is_running() returns True when container_running returns True (line 40)."""
         lc = make_lifecycle()
         with patch("wrknv.container.runtime.docker.run") as mock_run:
-            mock_run.return_value = CompletedProcess(args=[], returncode=0, stdout="test-container", stderr="")
+            mock_run.return_value = CompletedProcess(
+                args=[], returncode=0, stdout="test-container\trunning", stderr=""
+            )
             assert lc.is_running() is True
 
     def test_is_running_false(self):
@@ -75,12 +77,10 @@ class TestContainerLifecycleStart:
         """start() returns True when container is already running (line 60)."""
         lc = make_lifecycle()
         with patch("wrknv.container.runtime.docker.run") as mock_run:
-            mock_run.side_effect = [
-                # container_exists -> True
-                CompletedProcess(args=[], returncode=0, stdout="test-container", stderr=""),
-                # container_running -> True
-                CompletedProcess(args=[], returncode=0, stdout="test-container", stderr=""),
-            ]
+            # container_state -> running
+            mock_run.return_value = CompletedProcess(
+                args=[], returncode=0, stdout="test-container\trunning", stderr=""
+            )
             result = lc.start(create_if_missing=False)
 
         assert result is True
@@ -110,10 +110,8 @@ class TestContainerLifecycleStart:
         err = ProcessError(message="start failed", stderr="permission denied")
         with patch("wrknv.container.runtime.docker.run") as mock_run:
             mock_run.side_effect = [
-                # container_exists -> True
-                CompletedProcess(args=[], returncode=0, stdout="test-container", stderr=""),
-                # container_running -> False
-                CompletedProcess(args=[], returncode=0, stdout="", stderr=""),
+                # container_state -> stopped
+                CompletedProcess(args=[], returncode=0, stdout="test-container\texited", stderr=""),
                 # start_container raises
                 err,
             ]
@@ -212,7 +210,7 @@ class TestContainerLifecycleStop:
         with patch("wrknv.container.runtime.docker.run") as mock_run:
             mock_run.side_effect = [
                 # container_running -> True
-                CompletedProcess(args=[], returncode=0, stdout="test-container", stderr=""),
+                CompletedProcess(args=[], returncode=0, stdout="test-container\trunning", stderr=""),
                 # stop_container raises
                 err,
             ]
@@ -235,9 +233,9 @@ class TestContainerLifecycleRestart:
         with patch("wrknv.container.runtime.docker.run") as mock_run:
             mock_run.side_effect = [
                 # container_running check in restart -> True
-                CompletedProcess(args=[], returncode=0, stdout="test-container", stderr=""),
+                CompletedProcess(args=[], returncode=0, stdout="test-container\trunning", stderr=""),
                 # container_running check in stop -> True
-                CompletedProcess(args=[], returncode=0, stdout="test-container", stderr=""),
+                CompletedProcess(args=[], returncode=0, stdout="test-container\trunning", stderr=""),
                 # stop_container raises
                 err,
             ]
@@ -252,10 +250,8 @@ class TestContainerLifecycleRestart:
             mock_run.side_effect = [
                 # container_running check in restart -> False (skip stop)
                 CompletedProcess(args=[], returncode=0, stdout="", stderr=""),
-                # container_exists in start -> True
-                CompletedProcess(args=[], returncode=0, stdout="test-container", stderr=""),
-                # container_running in start -> False
-                CompletedProcess(args=[], returncode=0, stdout="", stderr=""),
+                # container_state in start -> stopped
+                CompletedProcess(args=[], returncode=0, stdout="test-container\texited", stderr=""),
                 # start_container
                 CompletedProcess(args=[], returncode=0, stdout="test-container", stderr=""),
             ]
@@ -286,7 +282,7 @@ class TestContainerLifecycleStatus:
     def test_status_process_error(self):
         """status() catches ProcessError and returns error dict (lines 191-197)."""
         runtime = MagicMock()
-        runtime.container_exists.side_effect = ProcessError(message="inspect failed")
+        runtime.container_state.side_effect = ProcessError(message="inspect failed")
         lc = ContainerLifecycle(
             runtime=runtime,
             container_name="test-container",
@@ -307,10 +303,8 @@ class TestContainerLifecycleStatus:
         lc = make_lifecycle()
         with patch("wrknv.container.runtime.docker.run") as mock_run:
             mock_run.side_effect = [
-                # container_exists -> True
-                CompletedProcess(args=[], returncode=0, stdout="test-container", stderr=""),
-                # container_running -> True
-                CompletedProcess(args=[], returncode=0, stdout="test-container", stderr=""),
+                # container_state -> running
+                CompletedProcess(args=[], returncode=0, stdout="test-container\trunning", stderr=""),
                 # inspect_container -> info without State
                 CompletedProcess(
                     args=[],
@@ -348,8 +342,8 @@ class TestContainerLifecycleRemove:
         lc = make_lifecycle()
         with patch("wrknv.container.runtime.docker.run") as mock_run:
             mock_run.side_effect = [
-                # container_exists -> True
-                CompletedProcess(args=[], returncode=0, stdout="test-container", stderr=""),
+                # container_state -> running
+                CompletedProcess(args=[], returncode=0, stdout="test-container\trunning", stderr=""),
                 # remove_container (force=True, skip running check)
                 CompletedProcess(args=[], returncode=0, stdout="test-container", stderr=""),
             ]
@@ -362,10 +356,8 @@ class TestContainerLifecycleRemove:
         lc = make_lifecycle()
         with patch("wrknv.container.runtime.docker.run") as mock_run:
             mock_run.side_effect = [
-                # container_exists -> True
-                CompletedProcess(args=[], returncode=0, stdout="test-container", stderr=""),
-                # container_running -> False (no stop needed)
-                CompletedProcess(args=[], returncode=0, stdout="", stderr=""),
+                # container_state -> stopped (no stop needed)
+                CompletedProcess(args=[], returncode=0, stdout="test-container\texited", stderr=""),
                 # remove_container
                 CompletedProcess(args=[], returncode=0, stdout="test-container", stderr=""),
             ]
@@ -378,12 +370,10 @@ class TestContainerLifecycleRemove:
         lc = make_lifecycle()
         with patch("wrknv.container.runtime.docker.run") as mock_run:
             mock_run.side_effect = [
-                # container_exists -> True
-                CompletedProcess(args=[], returncode=0, stdout="test-container", stderr=""),
-                # container_running (remove's check) -> True
-                CompletedProcess(args=[], returncode=0, stdout="test-container", stderr=""),
+                # container_state (remove's check) -> running
+                CompletedProcess(args=[], returncode=0, stdout="test-container\trunning", stderr=""),
                 # container_running (inside stop()) -> True
-                CompletedProcess(args=[], returncode=0, stdout="test-container", stderr=""),
+                CompletedProcess(args=[], returncode=0, stdout="test-container\trunning", stderr=""),
                 # stop_container succeeds
                 CompletedProcess(args=[], returncode=0, stdout="", stderr=""),
                 # remove_container
@@ -399,12 +389,10 @@ class TestContainerLifecycleRemove:
         err = ProcessError(message="stop failed")
         with patch("wrknv.container.runtime.docker.run") as mock_run:
             mock_run.side_effect = [
-                # container_exists -> True
-                CompletedProcess(args=[], returncode=0, stdout="test-container", stderr=""),
-                # container_running (remove's check) -> True
-                CompletedProcess(args=[], returncode=0, stdout="test-container", stderr=""),
+                # container_state (remove's check) -> running
+                CompletedProcess(args=[], returncode=0, stdout="test-container\trunning", stderr=""),
                 # container_running (inside stop()) -> True
-                CompletedProcess(args=[], returncode=0, stdout="test-container", stderr=""),
+                CompletedProcess(args=[], returncode=0, stdout="test-container\trunning", stderr=""),
                 # stop_container raises
                 err,
             ]
@@ -94,13 +94,24 @@ class TestDockerRuntime(FoundationTestCase):
     def test_container_exists_true(self, mock_run) -> None:
         """Test checking if container exists - found case."""
         mock_run.return_value = CompletedProcess(
-            args=["docker", "ps"], returncode=0, stdout="container1\ntest-container\ncontainer3", stderr=""
+            args=["docker", "ps"], returncode=0, stdout="test-container\texited", stderr=""
         )
 
         exists = self.runtime.container_exists("test-container")
 
         assert exists
-        mock_run.assert_called_once_with(["docker", "ps", "-a", "--format", "{{.Names}}"], check=False)
+        mock_run.assert_called_once_with(
+            [
+                "docker",
+                "ps",
+                "-a",
+                "--filter",
+                "name=^test\\-container$",
+                "--format",
+                "{{.Names}}\t{{.State}}",
+            ],
+            check=False,
+        )
 
     @patch("wrknv.container.runtime.docker.run")
     def test_container_exists_false(self, mock_run) -> None:
@@ -117,13 +128,24 @@ class TestDockerRuntime(FoundationTestCase):
     def test_container_running(self, mock_run) -> None:
         """Test checking if container is running."""
         mock_run.return_value = CompletedProcess(
-            args=["docker", "ps"], returncode=0, stdout="test-container\nother-container", stderr=""
+            args=["docker", "ps"], returncode=0, stdout="test-container\trunning", stderr=""
         )
 
         running = self.runtime.container_running("test-container")
 
         assert running
-        mock_run.assert_called_once_with(["docker", "ps", "--format", "{{.Names}}"], check=False)
+        mock_run.assert_called_once_with(
+            [
+                "docker",
+                "ps",
+                "-a",
+                "--filter",
+                "name=^test\\-container$",
+                "--format",
+                "{{.Names}}\t{{.State}}",
+            ],
+            check=False,
+        )
 
     @patch("wrknv.container.runtime.docker.run")
     def test_exec_in_container(self, mock_run) -> None:
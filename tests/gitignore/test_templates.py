@@ -12,7 +12,6 @@ import json
 from pathlib import Path
 from unittest import mock
 
-from provide.foundation.archive.operations import ArchiveOperations
 from provide.testkit.mocking import Mock, patch
 import pytest
 
@@ -236,7 +235,9 @@ class TestTemplateHandler:
 
         with (
             mock.patch.object(handler, "_is_cache_valid", return_value=False),
-            mock.patch("wrknv.wenv.operations.download.download_file", side_effect=Exception("network error")),
+            mock.patch.object(
+                handler, "_extract_archive_stream", side_effect=Exception("network error")
+            ),
         ):
             result = handler.update_cache(force=True)
 
@@ -311,27 +312,14 @@ class TestUpdateCacheSuccessPath:
         source_dir.mkdir()
         (source_dir / "Python.gitignore").write_text("*.pyc")
 
-        tmp_archive = tmp_path / "archive.tar.gz"
-        tmp_archive.write_bytes(b"fake")
-
         with (
-            mock.patch("wrknv.wenv.operations.download.download_file"),
-            mock.patch("tempfile.NamedTemporaryFile") as mock_ntf,
-            mock.patch("tempfile.TemporaryDirectory") as mock_td,
-            mock.patch.object(ArchiveOperations, "extract_tar_gz"),
+            mock.patch.object(handler, "_extract_archive_stream"),
+            mock.patch("tempfile.mkdtemp", return_value=str(extract_dir)),
+            mock.patch("os.rename", side_effect=OSError),
             mock.patch("wrknv.gitignore.templates.safe_rmtree"),
             mock.patch("wrknv.gitignore.templates.safe_move"),
-            mock.patch("pathlib.Path.unlink"),
             mock.patch.object(handler, "_update_version_file"),
         ):
-            mock_ntf.return_value.__enter__ = mock.MagicMock(
-                return_value=mock.MagicMock(name=str(tmp_archive))
-            )
-            mock_ntf.return_value.__exit__ = mock.MagicMock(return_value=False)
-
-            mock_td.return_value.__enter__ = mock.MagicMock(return_value=str(extract_dir))
-            mock_td.return_value.__exit__ = mock.MagicMock(return_value=False)
-
             with mock.patch.object(Path, "iterdir", return_value=iter([source_dir])):
                 result = handler.update_cache(force=True)
 
@@ -344,24 +332,10 @@ class TestUpdateCacheSuccessPath:
         extract_dir = tmp_path / "extract"
         extract_dir.mkdir()
 
-        tmp_archive = tmp_path / "archive.tar.gz"
-        tmp_archive.write_bytes(b"fake")
-
         with (
-            mock.patch("wrknv.wenv.operations.download.download_file"),
-            mock.patch("tempfile.NamedTemporaryFile") as mock_ntf,
-            mock.patch("tempfile.TemporaryDirectory") as mock_td,
-            mock.patch.object(ArchiveOperations, "extract_tar_gz"),
-            mock.patch("pathlib.Path.unlink"),
+            mock.patch.object(handler, "_extract_archive_stream"),
+            mock.patch("tempfile.mkdtemp", return_value=str(extract_dir)),
         ):
-            mock_ntf.return_value.__enter__ = mock.MagicMock(
-                return_value=mock.MagicMock(name=str(tmp_archive))
-            )
-            mock_ntf.return_value.__exit__ = mock.MagicMock(return_value=False)
-
-            mock_td.return_value.__enter__ = mock.MagicMock(return_value=str(extract_dir))
-            mock_td.return_value.__exit__ = mock.MagicMock(return_value=False)
-
             with mock.patch.object(Path, "iterdir", return_value=iter([])):
                 result = handler.update_cache(force=True)
 
@@ -378,32 +352,19 @@ class TestUpdateCacheSuccessPath:
         item1.mkdir()
         item2.mkdir()
 
-        tmp_archive = tmp_path / "archive.tar.gz"
-        tmp_archive.write_bytes(b"fake")
-
         moved_sources = []
 
         def capture_move(src: Path, dst: Path) -> None:
             moved_sources.append(src)
 
         with (
-            mock.patch("wrknv.wenv.operations.download.download_file"),
-            mock.patch("tempfile.NamedTemporaryFile") as mock_ntf,
-            mock.patch("tempfile.TemporaryDirectory") as mock_td,
-            mock.patch.object(ArchiveOperations, "extract_tar_gz"),
+            mock.patch.object(handler, "_extract_archive_stream"),
+            mock.patch("tempfile.mkdtemp", return_value=str(extract_dir)),
+            mock.patch("os.rename", side_effect=OSError),
             mock.patch("wrknv.gitignore.templates.safe_rmtree"),
             mock.patch("wrknv.gitignore.templates.safe_move", side_effect=capture_move),
-            mock.patch("pathlib.Path.unlink"),
             mock.patch.object(handler, "_update_version_file"),
         ):
-            mock_ntf.return_value.__enter__ = mock.MagicMock(
-                return_value=mock.MagicMock(name=str(tmp_archive))
-            )
-            mock_ntf.return_value.__exit__ = mock.MagicMock(return_value=False)
-
-            mock_td.return_value.__enter__ = mock.MagicMock(return_value=str(extract_dir))
-            mock_td.return_value.__exit__ = mock.MagicMock(return_value=False)
-
             with mock.patch.object(Path, "iterdir", return_value=iter([item1, item2])):
                 result = handler.update_cache(force=True)
 
@@ -424,35 +385,23 @@ class TestUpdateCacheSuccessPath:
 
         rmtree_calls = []
 
-        def capture_rmtree(path: Path) -> None:
+        def capture_rmtree(path: Path, **kwargs: bool) -> None:
             rmtree_calls.append(path)
 
-        tmp_archive = tmp_path / "archive.tar.gz"
-        tmp_archive.write_bytes(b"fake")
-
         with (
-            mock.patch("wrknv.wenv.operations.download.download_file"),
-            mock.patch("tempfile.NamedTemporaryFile") as mock_ntf,
-            mock.patch("tempfile.TemporaryDirectory") as mock_td,
-            mock.patch.object(ArchiveOperations, "extract_tar_gz"),
+            mock.patch.object(handler, "_extract_archive_stream"),
+            mock.patch("tempfile.mkdtemp", return_value=str(extract_dir)),
+            mock.patch("os.rename", side_effect=OSError),
             mock.patch("wrknv.gitignore.templates.safe_rmtree", side_effect=capture_rmtree),
             mock.patch("wrknv.gitignore.templates.safe_move"),
-            mock.patch("pathlib.Path.unlink"),
             mock.patch.object(handler, "_update_version_file"),
         ):
-            mock_ntf.return_value.__enter__ = mock.MagicMock(
-                return_value=mock.MagicMock(name=str(tmp_archive))
-            )
-            mock_ntf.return_value.__exit__ = mock.MagicMock(return_value=False)
-
-            mock_td.return_value.__enter__ = mock.MagicMock(return_value=str(extract_dir))
-            mock_td.return_value.__exit__ = mock.MagicMock(return_value=False)
-
             with mock.patch.object(Path, "iterdir", return_value=iter([source_dir])):
                 handler.update_cache(force=True)
 
         # safe_rmtree should have been called to clear existing cache
-        assert len(rmtree_calls) == 1
+        # (and once more to clean up the staging directory)
+        assert cache_dir in rmtree_calls
 
 
 class TestFetchCommitSha:
@@ -463,9 +412,11 @@ class TestFetchCommitSha:
         handler = TemplateHandler(cache_dir=tmp_path / "cache")
 
         mock_response = mock.MagicMock()
-        mock_response.json.return_value = {"sha": "abcdef1234567890"}
+        mock_response.read.return_value = json.dumps({"sha": "abcdef1234567890"}).encode()
+        mock_response.headers = {}
 
-        with mock.patch("asyncio.run", return_value=mock_response):
+        with mock.patch("urllib.request.urlopen") as mock_urlopen:
+            mock_urlopen.return_value.__enter__.return_value = mock_response
             result = handler._fetch_commit_sha()
 
         assert result == "abcdef12"
@@ -475,13 +426,51 @@ class TestFetchCommitSha:
         handler = TemplateHandler(cache_dir=tmp_path / "cache")
 
         mock_response = mock.MagicMock()
-        mock_response.json.return_value = {"sha": "deadbeef12345678"}
+        mock_response.read.return_value = json.dumps({"sha": "deadbeef12345678"}).encode()
+        mock_response.headers = {}
+
+        with mock.patch("urllib.request.urlopen") as mock_urlopen:
+            mock_urlopen.return_value.__enter__.return_value = mock_response
+            handler._fetch_commit_sha()
+
+        mock_urlopen.assert_called_once()
+        request = mock_urlopen.call_args[0][0]
+        assert request.full_url.endswith("/commits/main")
+
+    def test_fetch_commit_sha_stores_etag(self, tmp_path: Path) -> None:
+        """Test that _fetch_commit_sha saves the response ETag for reuse."""
+        cache_dir = tmp_path / "cache"
+        handler = TemplateHandler(cache_dir=cache_dir)
+
+        mock_response = mock.MagicMock()
+        mock_response.read.return_value = json.dumps({"sha": "abcdef1234567890"}).encode()
+        mock_response.headers = {"ETag": '"etag-value"'}
 
-        with mock.patch("asyncio.run", return_value=mock_response) as mock_run:
+        with mock.patch("urllib.request.urlopen") as mock_urlopen:
+            mock_urlopen.return_value.__enter__.return_value = mock_response
             handler._fetch_commit_sha()
 
-        # Verify asyncio.run was called
-        mock_run.assert_called_once()
+        assert (cache_dir / ".etag").read_text() == '"etag-value"'
+
+    def test_fetch_commit_sha_304_reuses_cached_version(self, tmp_path: Path) -> None:
+        """Test that an HTTP 304 answer returns the cached version."""
+        import urllib.error
+
+        cache_dir = tmp_path / "cache"
+        handler = TemplateHandler(cache_dir=cache_dir)
+        (cache_dir / ".etag").write_text('"etag-value"')
+        (cache_dir / ".version").write_text("cached12")
+
+        error = urllib.error.HTTPError(
+            url="https://api.github.com", code=304, msg="Not Modified", hdrs=None, fp=None
+        )
+
+        with mock.patch("urllib.request.urlopen", side_effect=error) as mock_urlopen:
+            result = handler._fetch_commit_sha()
+
+        assert result == "cached12"
+        request = mock_urlopen.call_args[0][0]
+        assert request.headers.get("If-none-match") == '"etag-value"'
 
 
 # 🧰🌍🔚
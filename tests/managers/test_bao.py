@@ -245,7 +245,7 @@ class TestBaoInstallFromArchive(FoundationTestCase):
         with (
             mock.patch.object(mgr, "extract_archive"),
             mock.patch.object(mgr, "verify_installation", return_value=True),
-            mock.patch("provide.foundation.file.safe_rmtree"),
+            mock.patch("wrknv.managers.bao.safe_rmtree"),
             pytest.raises(ToolManagerError, match="OpenBao binary not found"),
         ):
             mgr._install_from_archive(archive_path, "2.1.0")
@@ -265,8 +265,8 @@ class TestBaoInstallFromArchive(FoundationTestCase):
             mock.patch.object(mgr, "extract_archive", side_effect=fake_extract),
             mock.patch.object(mgr, "verify_installation", return_value=True),
             mock.patch.object(mgr, "make_executable"),
-            mock.patch("provide.foundation.file.safe_copy"),
-            mock.patch("provide.foundation.file.safe_rmtree"),
+            mock.patch("wrknv.managers.bao.safe_copy"),
+            mock.patch("wrknv.managers.bao.safe_rmtree"),
         ):
             mgr._install_from_archive(archive_path, "2.1.0")
 
@@ -284,8 +284,8 @@ class TestBaoInstallFromArchive(FoundationTestCase):
             mock.patch.object(mgr, "extract_archive", side_effect=fake_extract),
             mock.patch.object(mgr, "verify_installation", return_value=False),
             mock.patch.object(mgr, "make_executable"),
-            mock.patch("provide.foundation.file.safe_copy"),
-            mock.patch("provide.foundation.file.safe_rmtree"),
+            mock.patch("wrknv.managers.bao.safe_copy"),
+            mock.patch("wrknv.managers.bao.safe_rmtree"),
             pytest.raises(ToolManagerError, match="verification failed"),
         ):
             mgr._install_from_archive(archive_path, "2.1.0")
@@ -298,7 +298,7 @@ class TestBaoInstallFromArchive(FoundationTestCase):
 
         with (
             mock.patch.object(mgr, "extract_archive", side_effect=RuntimeError("extract failed")),
-            mock.patch("provide.foundation.file.safe_rmtree") as mock_rmtree,
+            mock.patch("wrknv.managers.bao.safe_rmtree") as mock_rmtree,
             contextlib.suppress(RuntimeError, ToolManagerError),
         ):
             mgr._install_from_archive(archive_path, "2.1.0")
@@ -322,8 +322,8 @@ class TestBaoInstallFromArchive(FoundationTestCase):
             mock.patch.object(mgr, "extract_archive", side_effect=fake_extract),
             mock.patch.object(mgr, "verify_installation", return_value=True),
             mock.patch.object(mgr, "make_executable"),
-            mock.patch("provide.foundation.file.safe_copy"),
-            mock.patch("provide.foundation.file.safe_rmtree"),
+            mock.patch("wrknv.managers.bao.safe_copy"),
+            mock.patch("wrknv.managers.bao.safe_rmtree"),
         ):
             mgr._install_from_archive(archive_path, "2.1.0")
 
@@ -113,7 +113,7 @@ class TestTfBaseInstallFromArchiveMultiFile(FoundationTestCase):
     """
 
     @patch("wrknv.managers.tf.base.safe_rmtree")
-    @patch("wrknv.managers.tf.base.calculate_file_hash", return_value="abc123")
+    @patch("wrknv.managers.tf.base.calculate_file_hash_and_size", return_value=("abc123", 123))
     @patch("wrknv.managers.tf.base.safe_copy")
     def test_rglob_skips_non_matching_file_and_finds_binary(
         self, mock_safe_copy, mock_hash, mock_rmtree
@@ -135,6 +135,11 @@ class TestTfBaseInstallFromArchiveMultiFile(FoundationTestCase):
         mock_extract_dir = MagicMock()
         mock_extract_dir.rglob.return_value = iter([non_matching, correct_binary])
 
+        # Direct root probe misses, forcing the rglob fallback
+        missing_candidate = MagicMock(spec=Path)
+        missing_candidate.is_file.return_value = False
+        mock_extract_dir.__truediv__ = MagicMock(return_value=missing_candidate)
+
         manager.cache_dir = MagicMock()
         manager.cache_dir.__truediv__ = MagicMock(return_value=mock_extract_dir)
 
@@ -164,7 +164,7 @@ class TestInstallFromArchiveBranches(FoundationTestCase):
             mock.patch.object(manager, "extract_archive"),
             mock.patch("wrknv.managers.tf.base.safe_copy"),
             mock.patch.object(manager, "make_executable"),
-            mock.patch("wrknv.managers.tf.base.calculate_file_hash", return_value="abc123"),
+            mock.patch("wrknv.managers.tf.base.calculate_file_hash_and_size", return_value=("abc123", 123)),
             mock.patch.object(manager, "_update_install_metadata"),
             mock.patch.object(manager, "_update_recent_file"),
             mock.patch.object(manager, "verify_installation", return_value=True),
@@ -192,7 +192,7 @@ class TestInstallFromArchiveBranches(FoundationTestCase):
             mock.patch.object(manager, "extract_archive"),
             mock.patch("wrknv.managers.tf.base.safe_copy"),
             mock.patch.object(manager, "make_executable"),
-            mock.patch("wrknv.managers.tf.base.calculate_file_hash", return_value="abc123"),
+            mock.patch("wrknv.managers.tf.base.calculate_file_hash_and_size", return_value=("abc123", 123)),
             mock.patch.object(manager, "_update_install_metadata"),
             mock.patch.object(manager, "_update_recent_file"),
             mock.patch.object(manager, "verify_installation", return_value=True),
@@ -233,7 +233,7 @@ class TestInstallFromArchiveBranches(FoundationTestCase):
             mock.patch.object(manager, "extract_archive"),
             mock.patch("wrknv.managers.tf.base.safe_copy"),
             mock.patch.object(manager, "make_executable"),
-            mock.patch("wrknv.managers.tf.base.calculate_file_hash", return_value="abc123"),
+            mock.patch("wrknv.managers.tf.base.calculate_file_hash_and_size", return_value=("abc123", 123)),
             mock.patch.object(manager, "_update_install_metadata"),
             mock.patch.object(manager, "_update_recent_file"),
             mock.patch.object(manager, "verify_installation", return_value=False),
@@ -262,7 +262,7 @@ class TestUpdateInstallMetadata(FoundationTestCase):
         binary.write_bytes(b"binary")
 
         with mock.patch.object(manager, "_save_metadata") as mock_save:
-            manager._update_install_metadata(version, archive_path, "abc123sha256")
+            manager._update_install_metadata(version, archive_path, "abc123sha256", 6)
 
         assert f"terraform_{version}" in manager.metadata
         assert manager.metadata[f"terraform_{version}"]["binary_sha256"] == "abc123sha256"
@@ -325,7 +325,9 @@ class TestCopyActiveBinaries(FoundationTestCase):
         manager = _make_manager(tmp)
         with mock.patch("wrknv.managers.tf.base.copy_tf_binaries_to_workenv") as mock_copy:
             manager._copy_active_binaries_to_venv()
-        mock_copy.assert_called_once_with(manager.workenv_bin_dir, manager.config)
+        mock_copy.assert_called_once_with(
+            manager.workenv_bin_dir, manager.config, managers={manager.tool_name: manager}
+        )
 
 
 # 🧰🌍🔚
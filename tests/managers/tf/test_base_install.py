@@ -264,7 +264,7 @@ class TestInstallFromArchive(FoundationTestCase):
             mock.patch.object(manager, "_update_recent_file"),
             mock.patch.object(manager, "verify_installation", return_value=True),
             mock.patch("wrknv.managers.tf.base.safe_copy"),
-            mock.patch("wrknv.managers.tf.base.calculate_file_hash", return_value="abc123"),
+            mock.patch("wrknv.managers.tf.base.calculate_file_hash_and_size", return_value=("abc123", 123)),
         ):
             manager._install_from_archive(archive_path, "1.7.0")
 
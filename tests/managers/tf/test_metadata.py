@@ -27,7 +27,7 @@ class TestTfMetadataManagerInit(FoundationTestCase):
     def test_init_empty_metadata(self) -> None:
         tmp = self.create_temp_dir()
         mgr = TfMetadataManager(tmp, "tofu")
-        assert mgr.metadata == {}
+        assert mgr.metadata == {"_schema_version": 2}
 
 
 class TestLoadMetadata(FoundationTestCase):
@@ -37,7 +37,7 @@ class TestLoadMetadata(FoundationTestCase):
         tmp = self.create_temp_dir()
         mgr = TfMetadataManager(tmp, "tofu")
         mgr.load_metadata()
-        assert mgr.metadata == {}
+        assert mgr.metadata == {"_schema_version": 2}
 
     def test_loads_existing_file(self) -> None:
         tmp = self.create_temp_dir()
@@ -51,7 +51,7 @@ class TestLoadMetadata(FoundationTestCase):
         (tmp / "metadata.json").write_text("not json{{{")
         mgr = TfMetadataManager(tmp, "tofu")
         mgr.load_metadata()
-        assert mgr.metadata == {}
+        assert mgr.metadata == {"_schema_version": 2}
 
     def test_migrates_active_tofu_key(self) -> None:
         tmp = self.create_temp_dir()
@@ -69,6 +69,24 @@ class TestLoadMetadata(FoundationTestCase):
         assert "active_terraform" not in mgr.metadata
         assert mgr.metadata["workenv"]["default"]["terraform_version"] == "1.7.0"
 
+    def test_stamped_file_skips_migration_scan(self) -> None:
+        tmp = self.create_temp_dir()
+        (tmp / "metadata.json").write_text('{"_schema_version": 2, "active_tofu": "1.5.0"}')
+        mgr = TfMetadataManager(tmp, "tofu")
+        mgr.load_metadata()
+        # Current-schema files are taken as-is, legacy-key scan skipped
+        assert mgr.metadata["active_tofu"] == "1.5.0"
+        assert "workenv" not in mgr.metadata
+
+    def test_unstamped_file_is_stamped_once(self) -> None:
+        tmp = self.create_temp_dir()
+        (tmp / "metadata.json").write_text('{"active_tofu": "1.5.0"}')
+        mgr = TfMetadataManager(tmp, "tofu")
+        mgr.load_metadata()
+        assert mgr.metadata["_schema_version"] == 2
+        on_disk = json.loads((tmp / "metadata.json").read_text())
+        assert on_disk["_schema_version"] == 2
+
 
 class TestSaveMetadata(FoundationTestCase):
     """Tests for save_metadata."""
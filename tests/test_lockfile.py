@@ -54,6 +54,14 @@ class TestResolvedTool(FoundationTestCase):
         assert tool.installed_at is None
         assert tool.install_path is None
 
+    def test_resolved_tool_is_slotted(self) -> None:
+        """Lockfiles hold many ResolvedTool instances; keep them slotted."""
+        tool = ResolvedTool(name="uv", version="0.5.0", resolved_from="0.5.x")
+
+        assert not hasattr(tool, "__dict__")
+        with pytest.raises(AttributeError):
+            tool.unknown_attribute = "value"  # type: ignore[attr-defined]
+
 
 class TestLockfile(FoundationTestCase):
     """Test Lockfile class."""
@@ -16,6 +16,7 @@ from wrknv.wenv.completions import (
     generate_fish_completions,
     generate_zsh_completions,
 )
+from wrknv.wenv.completions_gen import emit_bash, emit_fish, emit_zsh
 
 
 class TestCompletions(FoundationTestCase):
@@ -61,5 +62,21 @@ class TestCompletions(FoundationTestCase):
             generate_completions("powershell")
 
 
+class TestCompletionsCodegen(FoundationTestCase):
+    """Pin the shipped completion files to the spec-driven emitters."""
+
+    def test_bash_script_matches_spec(self) -> None:
+        """Shipped Bash script is exactly what emit_bash produces."""
+        assert generate_bash_completions() == emit_bash()
+
+    def test_zsh_script_matches_spec(self) -> None:
+        """Shipped Zsh script is exactly what emit_zsh produces."""
+        assert generate_zsh_completions() == emit_zsh()
+
+    def test_fish_script_matches_spec(self) -> None:
+        """Shipped Fish script is exactly what emit_fish produces."""
+        assert generate_fish_completions() == emit_fish()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
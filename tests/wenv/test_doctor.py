@@ -7,11 +7,10 @@
 
 from __future__ import annotations
 
+from importlib import metadata
 import os
 from pathlib import Path
 import sys
-import tomllib
-import types
 from unittest import mock
 
 from provide.testkit import FoundationTestCase
@@ -19,16 +18,6 @@ from provide.testkit import FoundationTestCase
 from wrknv.wenv.doctor import WrknvDoctor
 
 
-def _make_tomli_mock() -> types.ModuleType:
-    """Build a mock 'tomli' module backed by stdlib tomllib."""
-    m = types.ModuleType("tomli")
-    m.load = tomllib.load  # type: ignore[attr-defined]
-    return m
-
-
-_TOMLI_MOCK = _make_tomli_mock()
-
-
 class TestWrknvDoctorInit(FoundationTestCase):
     """Tests for WrknvDoctor.__init__."""
 
@@ -67,53 +56,40 @@ class TestCheckWrknvInstallation(FoundationTestCase):
 
     def test_passes_when_installed_and_cli_available(self) -> None:
         doctor = WrknvDoctor()
-        mock_result = mock.Mock()
-        mock_result.returncode = 0
-        with (
-            mock.patch("wrknv.wenv.doctor.run", return_value=mock_result),
-            mock.patch.object(doctor.console, "print"),
-        ):
+        doctor._path_commands = {"wrknv"}
+        with mock.patch.object(doctor.console, "print"):
             doctor._check_wrknv_installation()
         assert any("wrknv Installation" in c[0] for c in doctor.checks_passed)
         assert any("wrknv CLI" in c[0] for c in doctor.checks_passed)
 
     def test_warns_when_cli_not_in_path(self) -> None:
         doctor = WrknvDoctor()
-        mock_result = mock.Mock()
-        mock_result.returncode = 1
-        with (
-            mock.patch("wrknv.wenv.doctor.run", return_value=mock_result),
-            mock.patch.object(doctor.console, "print"),
-        ):
+        doctor._path_commands = set()
+        with mock.patch.object(doctor.console, "print"):
             doctor._check_wrknv_installation()
         assert any("wrknv CLI" in c[0] for c in doctor.checks_warning)
 
-    def test_warns_on_file_not_found(self) -> None:
+    def test_fails_when_package_metadata_missing(self) -> None:
         doctor = WrknvDoctor()
         with (
-            mock.patch("wrknv.wenv.doctor.run", side_effect=FileNotFoundError),
+            mock.patch(
+                "wrknv.wenv.doctor.metadata.version",
+                side_effect=metadata.PackageNotFoundError,
+            ),
             mock.patch.object(doctor.console, "print"),
         ):
             doctor._check_wrknv_installation()
-        assert any("wrknv CLI" in c[0] for c in doctor.checks_warning)
-
-    def test_fails_on_import_error(self) -> None:
-        doctor = WrknvDoctor()
-        # Temporarily hide wrknv from sys.modules
-        wrknv_mod = sys.modules.get("wrknv")
-        try:
-            sys.modules["wrknv"] = None  # type: ignore[assignment]
-            with mock.patch.object(doctor.console, "print"):
-                doctor._check_wrknv_installation()
-        finally:
-            if wrknv_mod is not None:
-                sys.modules["wrknv"] = wrknv_mod
         assert any("wrknv Installation" in c[0] for c in doctor.checks_failed)
 
     def test_fails_on_unexpected_exception(self) -> None:
         doctor = WrknvDoctor()
         with (
-            mock.patch("wrknv.wenv.doctor.run", side_effect=OSError("nope")),
+            mock.patch.object(
+                WrknvDoctor,
+                "_path_commands",
+                new_callable=mock.PropertyMock,
+                side_effect=OSError("nope"),
+            ),
             mock.patch.object(doctor.console, "print"),
         ):
             doctor._check_wrknv_installation()
@@ -125,32 +101,36 @@ class TestCheckDependencies(FoundationTestCase):
 
     def test_all_found(self) -> None:
         doctor = WrknvDoctor()
-        with mock.patch("shutil.which", return_value="/usr/bin/something"):
-            doctor._check_dependencies()
+        doctor._path_commands = {"uv", "git", "python3", "bash"}
+        doctor._check_dependencies()
         assert len(doctor.checks_passed) == 4
         assert len(doctor.checks_failed) == 0
         assert len(doctor.checks_warning) == 0
 
     def test_uv_not_found_goes_to_failed(self) -> None:
         doctor = WrknvDoctor()
-
-        def which_side(cmd: str) -> str | None:
-            return None if cmd == "uv" else "/usr/bin/cmd"
-
-        with mock.patch("shutil.which", side_effect=which_side):
-            doctor._check_dependencies()
+        doctor._path_commands = {"git", "python3", "bash"}
+        doctor._check_dependencies()
         assert any("uv" in c[0] for c in doctor.checks_failed)
 
     def test_optional_dep_not_found_goes_to_warning(self) -> None:
         doctor = WrknvDoctor()
-
-        def which_side(cmd: str) -> str | None:
-            return None if cmd == "git" else "/usr/bin/cmd"
-
-        with mock.patch("shutil.which", side_effect=which_side):
-            doctor._check_dependencies()
+        doctor._path_commands = {"uv", "python3", "bash"}
+        doctor._check_dependencies()
         assert any("git" in c[0] for c in doctor.checks_warning)
 
+    def test_path_commands_scans_each_path_dir_once(self) -> None:
+        doctor = WrknvDoctor()
+        tmp = self.create_temp_dir()
+        exe = tmp / "sometool"
+        exe.write_text("#!/bin/sh\n")
+        exe.chmod(0o755)
+        (tmp / "not-executable").write_text("data")
+        with mock.patch.dict(os.environ, {"PATH": f"{tmp}{os.pathsep}/nonexistent-dir"}):
+            commands = doctor._path_commands
+        assert "sometool" in commands
+        assert "not-executable" not in commands
+
 
 class TestCheckWorkenvStructure(FoundationTestCase):
     """Tests for _check_workenv_structure."""
@@ -342,12 +322,9 @@ class TestTestEnvScriptExecution(FoundationTestCase):
 class TestCheckConfigFiles(FoundationTestCase):
     """Tests for _check_config_files."""
 
-    def _with_tomli(self) -> mock._patch[types.ModuleType]:  # type: ignore[type-arg]
-        return mock.patch.dict(sys.modules, {"tomli": _TOMLI_MOCK})
-
     def test_no_config_warns(self) -> None:
         doctor = WrknvDoctor()
-        with mock.patch("pathlib.Path.cwd", return_value=Path("/nonexistent")), self._with_tomli():
+        with mock.patch("pathlib.Path.cwd", return_value=Path("/nonexistent")):
             doctor._check_config_files()
         assert any("wrknv.toml" in c[0] for c in doctor.checks_warning)
 
@@ -356,7 +333,7 @@ class TestCheckConfigFiles(FoundationTestCase):
         tmp = self.create_temp_dir()
         # Only create .wrknv.toml (not wrknv.toml)
         (tmp / ".wrknv.toml").write_text('[project]\nname = "test"\n')
-        with mock.patch("pathlib.Path.cwd", return_value=tmp), self._with_tomli():
+        with mock.patch("pathlib.Path.cwd", return_value=tmp):
             doctor._check_config_files()
         assert any("wrknv.toml" in c[0] for c in doctor.checks_passed)
 
@@ -364,7 +341,7 @@ class TestCheckConfigFiles(FoundationTestCase):
         doctor = WrknvDoctor()
         tmp = self.create_temp_dir()
         (tmp / "wrknv.toml").write_text('[project]\nname = "test"\n')
-        with mock.patch("pathlib.Path.cwd", return_value=tmp), self._with_tomli():
+        with mock.patch("pathlib.Path.cwd", return_value=tmp):
             doctor._check_config_files()
         assert any("wrknv.toml" in c[0] for c in doctor.checks_passed)
 
@@ -372,7 +349,7 @@ class TestCheckConfigFiles(FoundationTestCase):
         doctor = WrknvDoctor()
         tmp = self.create_temp_dir()
         (tmp / "wrknv.toml").write_text('[tools]\nterraform = "1.5.0"\n')
-        with mock.patch("pathlib.Path.cwd", return_value=tmp), self._with_tomli():
+        with mock.patch("pathlib.Path.cwd", return_value=tmp):
             doctor._check_config_files()
         assert any("project" in c[1] for c in doctor.checks_warning)
 
@@ -380,7 +357,7 @@ class TestCheckConfigFiles(FoundationTestCase):
         doctor = WrknvDoctor()
         tmp = self.create_temp_dir()
         (tmp / "wrknv.toml").write_text('[project]\nname = "x"\n[tools]\nterraform = "1.5.0"\n')
-        with mock.patch("pathlib.Path.cwd", return_value=tmp), self._with_tomli():
+        with mock.patch("pathlib.Path.cwd", return_value=tmp):
             doctor._check_config_files()
         assert any("Tools" in c[0] for c in doctor.checks_passed)
 
@@ -388,7 +365,7 @@ class TestCheckConfigFiles(FoundationTestCase):
         doctor = WrknvDoctor()
         tmp = self.create_temp_dir()
         (tmp / "wrknv.toml").write_text('[project]\nname = "x"\n[siblings]\npatterns = ["mypkg"]\n')
-        with mock.patch("pathlib.Path.cwd", return_value=tmp), self._with_tomli():
+        with mock.patch("pathlib.Path.cwd", return_value=tmp):
             doctor._check_config_files()
         assert any("Sibling" in c[0] for c in doctor.checks_passed)
 
@@ -396,7 +373,7 @@ class TestCheckConfigFiles(FoundationTestCase):
         doctor = WrknvDoctor()
         tmp = self.create_temp_dir()
         (tmp / "wrknv.toml").write_text("this is not valid TOML !!!")
-        with mock.patch("pathlib.Path.cwd", return_value=tmp), self._with_tomli():
+        with mock.patch("pathlib.Path.cwd", return_value=tmp):
             doctor._check_config_files()
         assert any("wrknv.toml" in c[0] for c in doctor.checks_failed)
 
@@ -406,10 +383,7 @@ class TestCheckSiblingPackages(FoundationTestCase):
 
     def test_no_config_returns_silently(self) -> None:
         doctor = WrknvDoctor()
-        with (
-            mock.patch("pathlib.Path.cwd", return_value=Path("/nonexistent")),
-            mock.patch.dict(sys.modules, {"tomli": _TOMLI_MOCK}),
-        ):
+        with mock.patch("pathlib.Path.cwd", return_value=Path("/nonexistent")):
             doctor._check_sibling_packages()
         assert len(doctor.checks_passed) == 0
         assert len(doctor.checks_failed) == 0
@@ -423,10 +397,7 @@ class TestCheckSiblingPackages(FoundationTestCase):
         sibling_path = parent / sibling_name
         sibling_path.mkdir(exist_ok=True)
         (tmp / "wrknv.toml").write_text(f'[siblings]\npatterns = ["{sibling_name}"]\n')
-        with (
-            mock.patch("pathlib.Path.cwd", return_value=tmp),
-            mock.patch.dict(sys.modules, {"tomli": _TOMLI_MOCK}),
-        ):
+        with mock.patch("pathlib.Path.cwd", return_value=tmp):
             doctor._check_sibling_packages()
         assert any("Sibling" in c[0] for c in doctor.checks_passed)
 
@@ -434,10 +405,7 @@ class TestCheckSiblingPackages(FoundationTestCase):
         doctor = WrknvDoctor()
         tmp = self.create_temp_dir()
         (tmp / "wrknv.toml").write_text('[siblings]\npatterns = ["nonexistent_sibling_xyz"]\n')
-        with (
-            mock.patch("pathlib.Path.cwd", return_value=tmp),
-            mock.patch.dict(sys.modules, {"tomli": _TOMLI_MOCK}),
-        ):
+        with mock.patch("pathlib.Path.cwd", return_value=tmp):
             doctor._check_sibling_packages()
         assert any("Sibling" in c[0] for c in doctor.checks_warning)
 
@@ -8,8 +8,6 @@
 from __future__ import annotations
 
 import os
-import tomllib
-import types
 from unittest import mock
 
 from provide.testkit import FoundationTestCase
@@ -18,16 +16,6 @@ import pytest
 from wrknv.wenv.doctor import WrknvDoctor, run_doctor
 
 
-def _make_tomli_mock() -> types.ModuleType:
-    """Build a mock 'tomli' module backed by stdlib tomllib."""
-    m = types.ModuleType("tomli")
-    m.load = tomllib.load  # type: ignore[attr-defined]
-    return m
-
-
-_TOMLI_MOCK = _make_tomli_mock()
-
-
 class TestPrintSummary(FoundationTestCase):
     """Tests for _print_summary."""
 
@@ -59,6 +59,26 @@ class TestWorkspaceManagerLoadConfig(FoundationTestCase):
             result = mgr.load_config()
         assert result is mock_config
 
+    def test_repeated_loads_parse_once_until_file_changes(self) -> None:
+        tmp = self.create_temp_dir()
+        mgr = WorkspaceManager(root=tmp)
+        mgr.config_dir.mkdir(exist_ok=True)
+        mgr.config_path.write_text("v1")
+
+        mock_config = mock.Mock(spec=WorkspaceConfig)
+        with (
+            mock.patch("wrknv.workspace.manager.read_toml", return_value={"root": str(tmp)}) as mock_read,
+            mock.patch("wrknv.workspace.manager.WorkspaceConfig.from_dict", return_value=mock_config),
+        ):
+            assert mgr.load_config() is mock_config
+            assert mgr.load_config() is mock_config
+            assert mock_read.call_count == 1
+
+            # A different size changes the cache key and forces a re-read
+            mgr.config_path.write_text("v2 longer")
+            assert mgr.load_config() is mock_config
+            assert mock_read.call_count == 2
+
 
 class TestWorkspaceManagerSaveConfig(FoundationTestCase):
     """Tests for WorkspaceManager.save_config."""
@@ -70,7 +90,7 @@ class TestWorkspaceManagerSaveConfig(FoundationTestCase):
         config.to_dict.return_value = {}
 
         with (
-            mock.patch("wrknv.workspace.manager.write_toml", side_effect=OSError("disk full")),
+            mock.patch("wrknv.workspace.manager.tomli_w.dump", side_effect=OSError("disk full")),
             pytest.raises(OSError),
         ):
             mgr.save_config(config)
@@ -80,11 +100,13 @@ class TestWorkspaceManagerSaveConfig(FoundationTestCase):
         mgr = WorkspaceManager(root=tmp)
         mgr.config_dir.mkdir(exist_ok=True)
         config = mock.Mock(spec=WorkspaceConfig)
-        config.to_dict.return_value = {}
+        config.to_dict.return_value = {"version": "1.0"}
 
-        with mock.patch("wrknv.workspace.manager.write_toml") as mock_write:
-            mgr.save_config(config)
-        mock_write.assert_called_once()
+        mgr.save_config(config)
+
+        assert mgr.config_path.read_text() == 'version = "1.0"\n'
+        # No temp file left behind from the atomic swap
+        assert list(mgr.config_dir.iterdir()) == [mgr.config_path]
 
 
 class TestWorkspaceManagerAddRepo(FoundationTestCase):
@@ -180,13 +202,9 @@ class TestWorkspaceManagerSetupWorkspace(FoundationTestCase):
         tmp = self.create_temp_dir()
         mgr = WorkspaceManager(root=tmp)
 
-        mock_path = mock.Mock(spec=Path)
-        mock_path.is_absolute.return_value = True
-        mock_path.exists.return_value = False
-
         mock_repo = mock.Mock()
         mock_repo.name = "ghost_repo"
-        mock_repo.path = mock_path
+        mock_repo.path = tmp / "does-not-exist"
 
         mock_config = mock.Mock(spec=WorkspaceConfig)
         mock_config.repos = [mock_repo]
@@ -229,7 +247,7 @@ class TestWorkspaceManagerSetupWorkspace(FoundationTestCase):
         with (
             mock.patch.object(mgr, "load_config", return_value=mock_config),
             mock.patch(
-                "wrknv.wenv.env_generator.create_project_env_scripts",
+                "wrknv.workspace.manager.create_project_env_scripts",
                 return_value=(repo_dir / "env.sh", repo_dir / "env.ps1"),
             ),
         ):
@@ -254,7 +272,7 @@ class TestWorkspaceManagerSetupWorkspace(FoundationTestCase):
         with (
             mock.patch.object(mgr, "load_config", return_value=mock_config),
             mock.patch(
-                "wrknv.wenv.env_generator.create_project_env_scripts",
+                "wrknv.workspace.manager.create_project_env_scripts",
                 side_effect=RuntimeError("generation failed"),
             ),
         ):
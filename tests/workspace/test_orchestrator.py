@@ -62,6 +62,30 @@ class TestWorkspaceOrchestrator:
         assert len(wrknv_repos) == 1
         assert wrknv_repos[0].name == "wrknv"
 
+    def test_discover_repos_reuses_cached_result(self, tmp_path: Path) -> None:
+        """Identical discovery queries walk the tree only once."""
+        (tmp_path / "myrepo" / ".git").mkdir(parents=True)
+        (tmp_path / "myrepo" / "pyproject.toml").write_text('[project]\nname = "myrepo"')
+
+        orchestrator = WorkspaceOrchestrator(root=tmp_path)
+
+        with mock.patch.object(
+            orchestrator.discovery, "discover_repos", wraps=orchestrator.discovery.discover_repos
+        ) as mock_discover:
+            first = orchestrator.discover_repos()
+            second = orchestrator.discover_repos()
+            assert mock_discover.call_count == 1
+            assert second is first
+
+            # A different query misses the cache, and invalidation
+            # forces a fresh walk for a repeated one
+            orchestrator.discover_repos(repo_filter="myrepo")
+            assert mock_discover.call_count == 2
+
+            orchestrator.invalidate_discovery_cache()
+            orchestrator.discover_repos()
+            assert mock_discover.call_count == 3
+
     @pytest.mark.asyncio
     async def test_run_task_sequential_no_repos(self, tmp_path: Path) -> None:
         """Test sequential execution with no repos."""
@@ -288,3 +312,34 @@ class TestWorkspaceOrchestratorEdgeCases:
 
         assert result.failed == 1
         assert result.succeeded == 0
+
+    @pytest.mark.asyncio
+    async def test_run_task_bounded_mixed_results(self, tmp_path: Path) -> None:
+        """Bounded mode aggregates success, failure, and skips."""
+        self._make_repo(tmp_path, "repo1", task_name="build")
+        self._make_repo(tmp_path, "repo2", task_name="build", task_cmd="exit 1")
+        self._make_repo(tmp_path, "repo3", task_name="other")
+
+        orchestrator = WorkspaceOrchestrator(root=tmp_path)
+        result = await orchestrator.run_task("build", concurrency=2)
+
+        assert result.succeeded == 1
+        assert result.failed == 1
+        assert result.skipped == 1
+        assert result.total_repos == 3
+
+    @pytest.mark.asyncio
+    async def test_run_task_bounded_exception_in_registry(self, tmp_path: Path) -> None:
+        """Bounded mode records an error result on registry failure."""
+        self._make_repo(tmp_path, "repo1", task_name="build")
+
+        orchestrator = WorkspaceOrchestrator(root=tmp_path)
+
+        with mock.patch(
+            "wrknv.workspace.orchestrator.TaskRegistry.from_repo",
+            side_effect=Exception("bounded error"),
+        ):
+            result = await orchestrator.run_task("build", concurrency=2)
+
+        assert result.failed == 1
+        assert result.succeeded == 0